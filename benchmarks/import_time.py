@@ -0,0 +1,81 @@
+"""
+Import-time benchmark with a regression budget for the food_ordering package.
+
+Every scenario imports some classes in a fresh interpreter started with "python -X importtime".
+The self times of all modules the scenario imports on top of a bare interpreter are summed,
+and the best of several runs is compared to the scenario's budget. The script also checks that
+a scenario loads only the package modules it needs, so that, for example, importing
+Notification never pulls in orders, pricing or search. It exits with status 1 on a regression.
+
+Usage: python benchmarks/import_time.py [runs] [budget_scale]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CORE_MODULES = {"food_ordering", "food_ordering.menu_item", "food_ordering.menu", "food_ordering.inventory",
+                "food_ordering.restaurant", "food_ordering.client", "food_ordering.order"}
+
+# Budgets leave room for a fresh checkout, where every module is compiled from source on import:
+# best times there were up to package only 2.1 ms, Notification 3.5 ms, Order 18 ms and
+# PricingEngine 22 ms, against 0.15, 3.1, 14 and 15 ms once bytecode is cached.
+# Pass a budget_scale above 1 on slower machines instead of loosening them.
+SCENARIOS = [
+    ("package only", "import food_ordering", {"food_ordering"}, 5.0),
+    ("Notification", "from food_ordering import Notification",
+     {"food_ordering", "food_ordering.notification"}, 8.0),
+    ("Order", "from food_ordering import Order", CORE_MODULES, 30.0),
+    ("PricingEngine", "from food_ordering import PricingEngine",
+     CORE_MODULES | {"food_ordering.pricing"}, 35.0),
+]
+
+
+def measure(statement: str) -> dict[str, int]:
+    """
+    Runs the statement in a fresh interpreter and returns the self import time of every module in microseconds.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_time)
+    return times
+
+
+def main():
+    """
+    Measures every scenario and prints its import time, budget and loaded package modules.
+    """
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    budget_scale = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    baseline = set(measure("pass"))
+    failures = []
+    for name, statement, allowed_modules, budget_ms in SCENARIOS:
+        best_ms = None
+        loaded = set()
+        for _ in range(runs):
+            times = measure(statement)
+            added = {module: time for module, time in times.items() if module not in baseline}
+            total_ms = sum(added.values()) / 1000
+            best_ms = total_ms if best_ms is None else min(best_ms, total_ms)
+            loaded = {module for module in added if module.split(".")[0] == "food_ordering"}
+        budget_ms *= budget_scale
+        status = "ok" if best_ms <= budget_ms else "OVER BUDGET"
+        print(f"{name:<15} {best_ms:7.2f} ms (budget {budget_ms:.1f} ms) {status}; "
+              f"modules: {', '.join(sorted(loaded))}")
+        if best_ms > budget_ms:
+            failures.append(f"{name}: {best_ms:.2f} ms exceeds the budget of {budget_ms:.1f} ms")
+        if loaded - allowed_modules:
+            failures.append(f"{name}: unexpected modules loaded: {', '.join(sorted(loaded - allowed_modules))}")
+    for failure in failures:
+        print(failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
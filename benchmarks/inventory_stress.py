@@ -0,0 +1,134 @@
+"""
+Stress test for Inventory reservations under many concurrent threads.
+
+Every thread keeps creating orders and adding the same dish until the dish sells out.
+At the end the number of portions sold must equal the initial stock exactly, the stock
+must be zero and the dish must be marked unavailable; otherwise the script fails.
+Afterwards half of the orders are cancelled, reopened and cancelled again, and the stock is
+checked after every step; adding to or removing from a cancelled order must not change it,
+and reopening an order whose portions were sold in the meantime must be rejected.
+Finally, removing a dish ordered before it was tracked and cancelling a delivered order
+must not add portions that were never taken out of stock.
+
+Usage: python benchmarks/inventory_stress.py [threads] [portions]
+"""
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from food_ordering import Client, Inventory, MenuItem, Order, Restaurant
+
+
+def check_stock(inventory: Inventory, dish: MenuItem, expected: int, step: str):
+    """
+    Fails if the stock of the dish or its availability does not match the expected number of portions.
+    """
+    portions = inventory.get_stock(dish)
+    if portions != expected or dish.get_is_available() != (expected > 0):
+        raise AssertionError(f"{step} left {portions} portions, expected {expected}.")
+
+
+def main():
+    """
+    Runs the stress test and prints the number of reservations per second.
+    """
+    threads_count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    portions = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    dish = MenuItem("Greek Salad", "Tomatoes, cucumber, feta cheese, olive oil.",
+                    15.00, 230, 300.00, ["Milk"], True, 10)
+    restaurant = Restaurant("Olivia", "Kyiv, Khreshchatyk, 15", 380964850106,
+                            {"Monday-Sunday": "10:00-22:00"}, "Greek", 5.0)
+    client = Client("Rodrigo", "Smith", "rodrigo_smith@gmail.com", 380944850106)
+    inventory = Inventory()
+    inventory.set_stock(dish, portions)
+    restaurant.set_inventory(inventory)
+    orders_per_thread = [[] for _ in range(threads_count)]
+
+    def buyer(slot: int):
+        while True:
+            order = Order(client, restaurant)
+            try:
+                order.add_item(dish, 1 + slot % 3)
+            except ValueError:
+                if dish.get_is_available():
+                    continue
+                return
+            orders_per_thread[slot].append(order)
+
+    threads = [threading.Thread(target=buyer, args=(slot,)) for slot in range(threads_count)]
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    elapsed = time.perf_counter() - started
+    orders = [order for slot_orders in orders_per_thread for order in slot_orders]
+    sold = sum(order.get_items()[dish] for order in orders)
+    if sold != portions or inventory.get_stock(dish) != 0 or dish.get_is_available():
+        raise AssertionError(f"Oversold or lost stock: sold {sold} of {portions}, "
+                             f"left {inventory.get_stock(dish)}, available {dish.get_is_available()}.")
+    cancelled = orders[::2]
+    released = sum(order.get_items()[dish] for order in cancelled)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for order in cancelled:
+            order.update_status("Cancelled")
+            order.update_status("Cancelled")
+        check_stock(inventory, dish, released, "Cancellation")
+        for order in cancelled:
+            order.update_status("Pending")
+        check_stock(inventory, dish, 0, "Reopening")
+        for order in cancelled:
+            order.update_status("Cancelled")
+        check_stock(inventory, dish, released, "Cancelling reopened orders")
+        for order in cancelled:
+            try:
+                order.add_item(dish, 1)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"Order {order.get_order_number()} accepted a dish after cancellation.")
+        check_stock(inventory, dish, released, "Adding to cancelled orders")
+        for order in cancelled[1::2]:
+            order.remove_item(dish)
+        check_stock(inventory, dish, released, "Removing from cancelled orders")
+        latecomer = Order(client, restaurant)
+        latecomer.add_item(dish, released)
+        reopened = cancelled[0]
+        try:
+            reopened.update_status("Pending")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("A cancelled order was reopened without stock.")
+        if reopened.get_status() != "Cancelled":
+            raise AssertionError("A rejected reopening changed the order status.")
+        check_stock(inventory, dish, 0, "Rejected reopening")
+        side_dish = MenuItem("Pita Bread", "Freshly baked pita.", 3.00, 150, 80.00, ["Gluten"], True, 5)
+        early_order = Order(client, restaurant)
+        early_order.add_item(side_dish, 5)
+        inventory.set_stock(side_dish, 2)
+        early_order.remove_item(side_dish)
+        check_stock(inventory, side_dish, 2, "Removing a dish ordered before it was tracked")
+        delivered = Order(client, restaurant)
+        delivered.add_item(side_dish, 2)
+        delivered.update_status("Delivered")
+        try:
+            delivered.update_status("Cancelled")
+        except ValueError:
+            pass
+        check_stock(inventory, side_dish, 0, "Cancelling a delivered order")
+    print(f"Threads: {threads_count}, portions: {portions}, orders: {len(orders)}")
+    print(f"No overselling: sold exactly {sold} portions in {elapsed:.2f} s "
+          f"({len(orders) / elapsed:,.0f} reservations per second)")
+    print(f"Cancelling {len(cancelled)} orders released {released} portions; "
+          f"reopen, cancel again, add-after-cancel, late tracking and delivered orders kept the stock consistent")
+
+
+if __name__ == "__main__":
+    main()
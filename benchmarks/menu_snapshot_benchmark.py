@@ -0,0 +1,93 @@
+"""
+Measures reader throughput of Menu while other threads edit it.
+
+Reader threads repeatedly take a snapshot with get_items() and iterate over it,
+checking that every snapshot is consistent: it holds all base dishes, at most one
+dish of the writer (which adds a dish and removes it again) and no duplicate names. The benchmark
+is run once without writers and once with a writer thread that keeps adding and
+removing dishes, and prints the number of snapshot reads per second for both runs.
+
+Usage: python benchmarks/menu_snapshot_benchmark.py [readers] [seconds]
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from food_ordering import Menu, MenuItem
+
+
+def make_item(number: int) -> MenuItem:
+    """
+    Creates a valid MenuItem whose name contains the given number.
+    """
+    return MenuItem(f"Dish {number}", f"Description of dish {number}.",
+                    10.00, 100, 200.00, ["Gluten"], True, 10)
+
+
+BASE_DISHES = 100
+
+
+def run(menu: Menu, readers: int, seconds: float, with_writer: bool) -> float:
+    """
+    Runs the reader threads, optionally alongside a writer, and returns the reads per second.
+    """
+    stop = threading.Event()
+    reads = [0] * readers
+    errors = []
+
+    def reader(slot: int):
+        while not stop.is_set():
+            items = menu.get_items()
+            names = set()
+            base_dishes = 0
+            for item in items:
+                name = item.get_name()
+                names.add(name)
+                base_dishes += int(name.split()[1]) < BASE_DISHES
+            if base_dishes != BASE_DISHES or len(items) - base_dishes > 1 or len(names) != len(items):
+                errors.append(f"Inconsistent snapshot: {base_dishes} base dishes, "
+                              f"{len(items) - base_dishes} writer dishes, {len(items) - len(names)} duplicates.")
+            reads[slot] += 1
+
+    def writer():
+        number = 0
+        while not stop.is_set():
+            menu.add_item(make_item(BASE_DISHES + number))
+            menu.remove_item(f"Dish {BASE_DISHES + number}")
+            number += 1
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    if with_writer:
+        threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise AssertionError(errors[0])
+    return sum(reads) / seconds
+
+
+def main():
+    """
+    Builds a menu of BASE_DISHES dishes and prints reader throughput with and without a writer.
+    """
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    menu = Menu("Benchmark Menu")
+    for number in range(BASE_DISHES):
+        menu.add_item(make_item(number))
+    idle = run(menu, readers, seconds, with_writer=False)
+    busy = run(menu, readers, seconds, with_writer=True)
+    print(f"Readers: {readers}, menu size: {len(menu.get_items())}, menu version: {menu.get_version()}")
+    print(f"Reads per second without writers: {idle:,.0f}")
+    print(f"Reads per second with a concurrent writer: {busy:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
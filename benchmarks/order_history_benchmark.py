@@ -0,0 +1,66 @@
+"""
+Measures OrderHistoryIndex page lookup latency for a large number of orders.
+
+The index is filled with synthetic order summaries spread over many clients, then pages of
+random clients are read, both the first page and pages continued from a cursor in the middle
+of the history. The p50 and p99 latencies of both kinds of lookups are printed.
+
+Usage: python benchmarks/order_history_benchmark.py [orders] [clients] [lookups]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from food_ordering import OrderHistoryIndex, OrderSummary
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Returns the value below which the given fraction of the sorted samples lies.
+    """
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def main():
+    """
+    Builds the index and prints the build time and the lookup latency percentiles.
+    """
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    lookups = int(sys.argv[3]) if len(sys.argv) > 3 else 10000
+    emails = [f"client{number}@example.com" for number in range(clients)]
+    restaurants = ["Olivia", "Sakura", "Trattoria", "Burger Lab"]
+    statuses = ["Delivered", "Delivered", "Delivered", "Cancelled"]
+    start_time = datetime(2025, 1, 1)
+    index = OrderHistoryIndex()
+    started = time.perf_counter()
+    for number in range(orders):
+        index.add_summary(emails[number % clients],
+                          OrderSummary(number, restaurants[number % 4], 10.0 + number % 50,
+                                       statuses[number % 4], start_time + timedelta(seconds=number)))
+    print(f"Indexed {orders:,} orders of {clients:,} clients in {time.perf_counter() - started:.1f} s")
+    first_page = []
+    next_page = []
+    for _ in range(lookups):
+        email = random.choice(emails)
+        lookup_started = time.perf_counter()
+        page, cursor = index.get_page(email, limit=20)
+        first_page.append(time.perf_counter() - lookup_started)
+        if cursor is not None:
+            lookup_started = time.perf_counter()
+            index.get_page(email, limit=20, cursor=cursor)
+            next_page.append(time.perf_counter() - lookup_started)
+    for name, samples in (("first page", first_page), ("next page", next_page)):
+        if not samples:
+            continue
+        samples.sort()
+        print(f"{name:<10} p50 {percentile(samples, 0.50) * 1e6:7.1f} us, "
+              f"p99 {percentile(samples, 0.99) * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
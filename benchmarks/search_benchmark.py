@@ -0,0 +1,120 @@
+"""
+Measures MenuSearchIndex query latency on a large catalogue, alone and next to concurrent writers.
+
+The benchmark indexes a generated catalogue (1,000,000 dishes spread over 1,000 menus by default)
+and prints the median and 99th percentile latency of a set of queries, including common words,
+multi-word queries, prefixes and typos. It then repeats the queries while a writer thread keeps
+adding and removing dishes through their menus, and fails if any search raises an error or
+returns an item that is not a MenuItem.
+
+Usage: python benchmarks/search_benchmark.py [items] [menus] [seconds]
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from food_ordering import Menu, MenuItem, MenuSearchIndex
+
+ADJECTIVES = ["Greek", "Grilled", "Spicy", "Fresh", "Roasted", "Crispy", "Smoked", "Creamy", "Garden", "Classic",
+              "Baked", "Sweet", "Homemade", "Rustic", "Tuscan", "Thai", "Mexican", "Italian", "Warm", "Chilled"]
+DISHES = ["Salad", "Pasta", "Soup", "Burger", "Pizza", "Risotto", "Curry", "Tacos", "Sandwich", "Steak",
+          "Noodles", "Wrap", "Bowl", "Omelette", "Pancakes", "Dumplings", "Lasagna", "Chowder", "Skewers", "Pie"]
+INGREDIENTS = ["tomatoes", "cucumber", "feta", "cheese", "olive", "oil", "tuna", "chicken", "beef", "mushrooms",
+               "garlic", "basil", "lemon", "rice", "onion", "peppers", "spinach", "bacon", "cream", "butter",
+               "potatoes", "shrimp", "salmon", "avocado", "corn", "beans", "parmesan", "mozzarella", "herbs", "honey"]
+QUERIES = ["salad", "salad with olive oil", "greek salad", "tuna", "feta cheese", "chicken curry rice",
+           "spicy", "mozz", "sal", "tunna", "parmesean", "grilled salmon with lemon and herbs"]
+
+
+def make_item(rng: random.Random, number: int) -> MenuItem:
+    """
+    Creates a valid MenuItem with a generated name and description.
+    """
+    name = f"{rng.choice(ADJECTIVES)} {rng.choice(DISHES)} {number % 5000}"
+    description = ", ".join(rng.sample(INGREDIENTS, rng.randint(3, 8))) + " with house sauce."
+    return MenuItem(name, description, 10.00, 100, 200.00, ["Gluten"], True, 10)
+
+
+def measure(search_index: MenuSearchIndex, rounds: int) -> dict[str, tuple[float, float]]:
+    """
+    Runs every query the given number of times and returns its median and p99 latency in milliseconds.
+    """
+    latencies = {}
+    for query in QUERIES:
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            results = search_index.search(query)
+            samples.append((time.perf_counter() - started) * 1000)
+            if any(not isinstance(item, MenuItem) for item in results):
+                raise AssertionError(f"Search for '{query}' returned an object that is not a MenuItem.")
+        samples.sort()
+        latencies[query] = (samples[len(samples) // 2], samples[min(len(samples) - 1, len(samples) * 99 // 100)])
+    return latencies
+
+
+def main():
+    """
+    Builds the catalogue, then prints query latencies without and with a concurrent writer.
+    """
+    items_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    menus_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 3.0
+    rng = random.Random(42)
+    search_index = MenuSearchIndex()
+    menus = [Menu(f"Menu {number}") for number in range(menus_count)]
+    for menu in menus:
+        menu.set_search_index(search_index)
+    started = time.perf_counter()
+    for number in range(items_count):
+        menus[number % menus_count].add_item(make_item(rng, number))
+    print(f"Indexed {search_index.get_item_count():,} items in {time.perf_counter() - started:.1f} s")
+
+    idle = measure(search_index, 50)
+    stop = threading.Event()
+    errors = []
+    writes = [0]
+
+    def writer():
+        writer_rng = random.Random(7)
+        number = items_count
+        while not stop.is_set():
+            menu = menus[number % menus_count]
+            item = make_item(writer_rng, number)
+            menu.add_item(item)
+            menu.remove_item(item.get_name())
+            writes[0] += 1
+            number += 1
+
+    def reader():
+        while not stop.is_set():
+            try:
+                measure(search_index, 1)
+            except Exception as error:
+                errors.append(repr(error))
+                return
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise AssertionError(f"Search failed next to a writer: {errors[0]}")
+    busy = measure(search_index, 20)
+    print(f"{'query':<40} {'p50 ms':>8} {'p99 ms':>8}")
+    for query in QUERIES:
+        print(f"{query:<40} {idle[query][0]:8.2f} {idle[query][1]:8.2f}")
+    print(f"Concurrent writer: {writes[0]:,} add/remove pairs in {seconds:.0f} s, no search errors")
+    print(f"Median latency after the writer run: "
+          f"{sum(busy[query][0] for query in QUERIES) / len(QUERIES):.2f} ms on average per query")
+
+
+if __name__ == "__main__":
+    main()
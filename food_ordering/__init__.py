@@ -0,0 +1,64 @@
+"""
+Food Ordering System: a basic model for managing food orders in a restaurant.
+
+Every class lives in its own module and is loaded on first access through the package,
+for example "from food_ordering import Notification" imports only the notification module.
+Short-lived processes therefore pay only for the classes they actually use, and optional
+subsystems such as search, pricing, delivery batching or export are never imported unless
+they are needed.
+"""
+
+_LAZY_ATTRIBUTES = {
+    "MenuItem": "menu_item",
+    "Menu": "menu",
+    "MenuSearchIndex": "search",
+    "Inventory": "inventory",
+    "Restaurant": "restaurant",
+    "Client": "client",
+    "Order": "order",
+    "OrderColumnarExporter": "export",
+    "OrderIdempotencyCache": "idempotency",
+    "PricingRule": "pricing",
+    "PercentOffRule": "pricing",
+    "BuyNGetMRule": "pricing",
+    "PriceBreakdown": "pricing",
+    "PricingEngine": "pricing",
+    "DeliveryBatch": "delivery",
+    "DeliveryBatcher": "delivery",
+    "Notification": "notification",
+    "NotificationTemplate": "templates",
+    "NotificationTemplates": "templates",
+    "NotificationCoalescer": "coalescing",
+    "RecommendationEngine": "recommendation",
+    "OrderSummary": "history",
+    "OrderHistoryIndex": "history",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    """
+    Imports the module that defines the requested class on first access and caches the class.
+
+    :param name: the name of the attribute being looked up.
+    :return: the class with the given name.
+    :raises AttributeError: if the package has no attribute with the given name.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ is used instead of importlib.import_module to avoid importing importlib at startup.
+    module = __import__(f"{__name__}.{module_name}", globals(), None, [name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Lists the public classes of the package, including the ones not loaded yet.
+
+    :return: a sorted list of attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
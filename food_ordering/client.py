@@ -0,0 +1,88 @@
+class Client:
+    """
+    Represents a client of the restaurant, storing their personal and contact information.
+    """
+    def __init__(self, name: str, surname: str,  email: str, phone: int):
+        """
+        Initializes a new Client object.
+
+        This method validates the name, surname, email, and phone number
+        to ensure all contact details are valid and present.
+
+        :param name: the first name of the client. Must be a non-empty string.
+        :param surname: the last name (surname) of the client. Must be a non-empty string.
+        :param email: the email address of the client. Must be a non-empty string and contain '@'.
+        :param phone: the phone number of the client. Must be a non-empty string.
+        :raises TypeError: if any parameter is not of the expected string type.
+        :raises ValueError: if 'name', 'surname', 'email', or 'phone' are empty,
+        or if 'email' does not contain '@'.
+        """
+        if not isinstance(name, str):
+            raise TypeError("Client name must be a string.")
+        if not name:
+            raise ValueError("Client name cannot be empty.")
+        if not isinstance(surname, str):
+            raise TypeError("Client surname must be a string.")
+        if not surname:
+            raise ValueError("Client surname cannot be empty.")
+        if not isinstance(email, str):
+            raise TypeError("Client email must be a string.")
+        if not email or "@" not in email:
+            raise ValueError("Invalid client email.")
+        if not isinstance(phone, int):
+            raise TypeError("Client phone must be a string.")
+        if not phone:
+            raise ValueError("Client phone cannot be empty.")
+        self._name = name
+        self._surname = surname
+        self._email = email
+        self._phone = phone
+
+    def get_name(self) -> str:
+        """
+        Retrieves the first name of the client.
+
+        :return: the client's first name as a string.
+        :rtype: str
+        """
+        return self._name
+    def get_surname(self) -> str:
+        """
+        Retrieves the surname (last name) of the client.
+
+        :return: The client's surname as a string.
+        :rtype: str
+        """
+        return self._surname
+    def get_email(self) -> str:
+        """
+        Retrieves the email address of the client.
+
+        :return: the client's email address as a string.
+        :rtype: str
+        """
+        return self._email
+    def get_phone(self) -> int:
+        """
+        Retrieves the phone number of the client.
+
+        :return: the client's phone number as a string.
+        :rtype: str
+        """
+        return self._phone
+
+    def __str__(self):
+        """
+        Returns a formatted string representation of the Client object.
+
+        This includes the client's full name (first name and surname),
+        email address, and phone number, making it easy to display client details.
+
+        :return: a comprehensive string detailing the client's information.
+        :rtype: str
+        """
+        full_name = f"{self._name} {self._surname}".strip()
+        return (f"\n"
+                f"Client: {full_name}\n"
+                f"Email: {self._email}\n"
+                f"Phone: {self._phone}")
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+from .notification import Notification
+
+class NotificationCoalescer:
+    """
+    Merges notifications to the same recipient that arrive within a time window into a single send.
+
+    Notifications are buffered per recipient email and notification type. When the window of the
+    first buffered notification has passed, all buffered messages are sent as one notification.
+    """
+    def __init__(self, window_seconds: float = 60.0):
+        """
+        Initializes a new NotificationCoalescer object.
+
+        :param window_seconds: how long notifications to one recipient are collected before sending.
+        Must be a positive float.
+        :type window_seconds: float
+        :raises TypeError: if window_seconds is not a float.
+        :raises ValueError: if window_seconds is not positive.
+        """
+        if not isinstance(window_seconds, float):
+            raise TypeError("Coalescing window must be a float.")
+        if window_seconds <= 0:
+            raise ValueError("Coalescing window must be a positive number of seconds.")
+        self._window_seconds = window_seconds
+        self._pending: dict[tuple[str, str], tuple[datetime, list[Notification]]] = {}
+        self._submitted = 0
+        self._sent = 0
+
+    def submit(self, notification: Notification, now: datetime | None = None) -> list[str]:
+        """
+        Buffers a notification and sends every batch whose window has passed.
+
+        :param notification: the Notification object to send.
+        :type notification: Notification
+        :param now: the current time. Defaults to datetime.now().
+        :type now: datetime | None
+        :return: the confirmations of the notifications sent during this call.
+        :rtype: list[str]
+        :raises TypeError: if notification is not a Notification object.
+        """
+        if not isinstance(notification, Notification):
+            raise TypeError("Can only coalesce Notification objects.")
+        if now is None:
+            now = datetime.now()
+        sent = self.flush_due(now)
+        key = (notification.get_recipient_email(), notification.get_notification_type())
+        if key in self._pending:
+            self._pending[key][1].append(notification)
+        else:
+            self._pending[key] = (now, [notification])
+        self._submitted += 1
+        return sent
+
+    def flush_due(self, now: datetime | None = None) -> list[str]:
+        """
+        Sends the buffered notifications of every recipient whose window has passed.
+
+        :param now: the current time. Defaults to datetime.now().
+        :type now: datetime | None
+        :return: the confirmations of the sent notifications.
+        :rtype: list[str]
+        """
+        if now is None:
+            now = datetime.now()
+        due = [key for key, (first_time, _) in self._pending.items()
+               if (now - first_time).total_seconds() >= self._window_seconds]
+        return [self._send(key) for key in due]
+
+    def flush_all(self) -> list[str]:
+        """
+        Sends the buffered notifications of every recipient regardless of the window.
+
+        :return: the confirmations of the sent notifications.
+        :rtype: list[str]
+        """
+        return [self._send(key) for key in list(self._pending)]
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves counters describing how many sends coalescing has saved.
+
+        :return: a dictionary with the number of submitted, pending and sent notifications
+        and the number of messages saved by merging.
+        :rtype: dict
+        """
+        pending = sum(len(notifications) for _, notifications in self._pending.values())
+        return {
+            "submitted": self._submitted,
+            "pending": pending,
+            "sent": self._sent,
+            "saved": self._submitted - pending - self._sent,
+        }
+
+    def _send(self, key: tuple[str, str]) -> str:
+        """
+        Sends the notifications buffered under the key as a single notification.
+        """
+        _, notifications = self._pending.pop(key)
+        if len(notifications) == 1:
+            merged = notifications[0]
+        else:
+            merged = Notification("\n".join(notification.get_message() for notification in notifications),
+                                  key[0], key[1])
+        self._sent += 1
+        return merged.send()
@@ -0,0 +1,365 @@
+import math
+from datetime import datetime
+
+from .order import Order
+from .restaurant import Restaurant
+
+class DeliveryBatch:
+    """
+    Represents a group of orders from one restaurant that are delivered by a single courier.
+
+    The orders are kept in the sequence in which the courier visits the clients, together with
+    the time when each of them became ready for pickup.
+    """
+    def __init__(self, restaurant: Restaurant, created_time: datetime):
+        """
+        Initializes a new, empty DeliveryBatch object.
+
+        :param restaurant: the Restaurant object the orders are picked up from.
+        :param created_time: the time when the first order of the batch became ready.
+        :type restaurant: Restaurant
+        :type created_time: datetime
+        """
+        self._restaurant = restaurant
+        self._created_time = created_time
+        self._orders: list[Order] = []
+        self._ready_times: dict[Order, datetime] = {}
+        self._route_distance_km = 0.0
+        self._added_latency_minutes = 0.0
+
+    def get_restaurant(self) -> Restaurant:
+        """
+        Retrieves the Restaurant object the batch is picked up from.
+
+        :return: the Restaurant object of the batch.
+        :rtype: Restaurant
+        """
+        return self._restaurant
+    def get_created_time(self) -> datetime:
+        """
+        Retrieves the time when the first order of the batch became ready.
+
+        :return: a datetime object representing the creation time of the batch.
+        :rtype: datetime
+        """
+        return self._created_time
+    def get_orders(self) -> list[Order]:
+        """
+        Retrieves the orders of the batch in delivery sequence.
+
+        :return: a list of Order objects.
+        :rtype: list[Order]
+        """
+        return self._orders
+    def get_ready_time(self, order: Order) -> datetime:
+        """
+        Retrieves the time when an order of the batch became ready for pickup.
+
+        :param order: the Order object of the batch.
+        :type order: Order
+        :return: a datetime object representing the ready time of the order.
+        :rtype: datetime
+        """
+        return self._ready_times[order]
+    def get_route_distance_km(self) -> float:
+        """
+        Retrieves the length of the route from the restaurant through all delivery addresses.
+
+        :return: the route distance in kilometres as a float.
+        :rtype: float
+        """
+        return self._route_distance_km
+    def get_added_latency_minutes(self) -> float:
+        """
+        Retrieves the total delay the batch adds compared to delivering every order on its own
+        as soon as it is ready: the time spent waiting for the dispatch plus the detour of the route.
+
+        :return: the added latency in minutes as a float, summed over all orders of the batch.
+        :rtype: float
+        """
+        return self._added_latency_minutes
+
+    def insert_order(self, position: int, order: Order, ready_time: datetime):
+        """
+        Inserts an order into the delivery sequence at the given position.
+
+        :param position: the index in the delivery sequence at which the order is visited.
+        :type position: int
+        :param order: the Order object to insert.
+        :type order: Order
+        :param ready_time: the time when the order became ready for pickup.
+        :type ready_time: datetime
+        """
+        self._orders.insert(position, order)
+        self._ready_times[order] = ready_time
+
+    def remove_order(self, order: Order):
+        """
+        Removes an order from the delivery sequence, for example because it was cancelled while waiting.
+
+        :param order: the Order object to remove.
+        :type order: Order
+        """
+        self._orders.remove(order)
+        del self._ready_times[order]
+
+    def set_route_metrics(self, route_distance_km: float, added_latency_minutes: float):
+        """
+        Records the route length and the added latency computed when the batch is dispatched.
+
+        :param route_distance_km: the length of the route in kilometres.
+        :type route_distance_km: float
+        :param added_latency_minutes: the total latency added by batching in minutes.
+        :type added_latency_minutes: float
+        """
+        self._route_distance_km = route_distance_km
+        self._added_latency_minutes = added_latency_minutes
+
+    def __str__(self):
+        """
+        Returns a human-readable string representation of the DeliveryBatch object.
+
+        :return: a formatted string with the restaurant, the delivery sequence and the route length.
+        :rtype: str
+        """
+        order_numbers = ", ".join(f"#{order.get_order_number()}" for order in self._orders)
+        return (f"\n"
+                f"Delivery batch from: {self._restaurant.get_name()}\n"
+                f"Orders: {order_numbers}\n"
+                f"Route: {self._route_distance_km:.2f} km\n"
+                f"Added latency: {self._added_latency_minutes:.1f} minutes")
+
+class DeliveryBatcher:
+    """
+    Groups orders that are ready at the same restaurant into delivery batches.
+
+    Every restaurant has at most one open batch. A new order is inserted into the open batch
+    at the position of the route where it adds the shortest detour, which costs at most
+    O(capacity^2) distance computations per order. The batch is dispatched when it is full,
+    when its time window has passed, or when the new order would delay some delivery more
+    than the allowed detour. Dispatched orders are moved to the "Out for Delivery" status;
+    orders cancelled or delivered while waiting in a batch are dropped at dispatch, and a batch
+    left without orders is not dispatched at all.
+    """
+    def __init__(self, coordinates: dict, capacity: int = 3, window_minutes: float = 10.0,
+                 max_detour_minutes: float = 15.0, speed_kmh: float = 25.0):
+        """
+        Initializes a new DeliveryBatcher object.
+
+        :param coordinates: a dictionary mapping restaurant addresses and client emails to
+        (latitude, longitude) tuples. Must be a dictionary.
+        :param capacity: the maximum number of orders a courier can carry. Must be a positive integer.
+        :param window_minutes: how long a batch waits for more orders after its first order is ready.
+        Must be a positive float.
+        :param max_detour_minutes: the maximum delay batching may add to a single delivery.
+        Must be a non-negative float.
+        :param speed_kmh: the average courier speed in kilometres per hour. Must be a positive float.
+        :raises TypeError: if any parameter is not of the expected type.
+        :raises ValueError: if any parameter fails validation.
+        """
+        if not isinstance(coordinates, dict):
+            raise TypeError("Coordinates must be a dict.")
+        if not isinstance(capacity, int):
+            raise TypeError("Courier capacity must be an integer.")
+        if capacity <= 0:
+            raise ValueError("Courier capacity must be a positive integer.")
+        if not isinstance(window_minutes, float):
+            raise TypeError("Batching window must be a float.")
+        if window_minutes <= 0:
+            raise ValueError("Batching window must be a positive number of minutes.")
+        if not isinstance(max_detour_minutes, float):
+            raise TypeError("Maximum detour must be a float.")
+        if max_detour_minutes < 0:
+            raise ValueError("Maximum detour cannot be negative.")
+        if not isinstance(speed_kmh, float):
+            raise TypeError("Courier speed must be a float.")
+        if speed_kmh <= 0:
+            raise ValueError("Courier speed must be a positive number.")
+        self._coordinates = coordinates
+        self._capacity = capacity
+        self._window_minutes = window_minutes
+        self._max_detour_km = max_detour_minutes * speed_kmh / 60
+        self._speed_kmh = speed_kmh
+        self._open_batches: dict[Restaurant, DeliveryBatch] = {}
+        self._orders_dispatched = 0
+        self._batches_dispatched = 0
+        self._added_latency_minutes = 0.0
+
+    def add_order(self, order: Order, ready_time: datetime | None = None) -> list[DeliveryBatch]:
+        """
+        Adds an order that is ready for pickup to the open batch of its restaurant.
+
+        :param order: the Order object that is ready for delivery.
+        :type order: Order
+        :param ready_time: the time when the order became ready. Defaults to the current time.
+        :type ready_time: datetime | None
+        :return: the batches dispatched because of this order (possibly empty).
+        :rtype: list[DeliveryBatch]
+        :raises TypeError: if order is not an Order object.
+        :raises ValueError: if the order is already finished or waiting in a batch, or no coordinates
+        are known for its restaurant address or client email.
+        """
+        if not isinstance(order, Order):
+            raise TypeError("Can only batch Order objects.")
+        if order.get_status() in ("Out for Delivery", "Delivered", "Cancelled"):
+            raise ValueError(f"Order {order.get_order_number()} cannot be batched in status {order.get_status()}.")
+        restaurant = order.get_restaurant()
+        self._get_location(restaurant.get_address())
+        self._get_location(order.get_client().get_email())
+        batch = self._open_batches.get(restaurant)
+        if batch is not None and order in batch.get_orders():
+            raise ValueError(f"Order {order.get_order_number()} is already waiting for delivery.")
+        if ready_time is None:
+            ready_time = datetime.now()
+        dispatched = []
+        if batch is not None and (ready_time - batch.get_created_time()).total_seconds() > self._window_minutes * 60:
+            dispatched.append(self._dispatch(batch, ready_time))
+            batch = None
+        if batch is not None and not self._insert(batch, order, ready_time):
+            dispatched.append(self._dispatch(batch, ready_time))
+            batch = None
+        if batch is None:
+            batch = DeliveryBatch(restaurant, ready_time)
+            self._open_batches[restaurant] = batch
+            self._insert(batch, order, ready_time)
+        if len(batch.get_orders()) >= self._capacity:
+            dispatched.append(self._dispatch(batch, ready_time))
+        return [batch for batch in dispatched if batch is not None]
+
+    def dispatch_due(self, now: datetime | None = None) -> list[DeliveryBatch]:
+        """
+        Dispatches every open batch whose time window has passed.
+
+        :param now: the current time. Defaults to datetime.now().
+        :type now: datetime | None
+        :return: the dispatched batches.
+        :rtype: list[DeliveryBatch]
+        """
+        if now is None:
+            now = datetime.now()
+        due = [batch for batch in self._open_batches.values()
+               if (now - batch.get_created_time()).total_seconds() >= self._window_minutes * 60]
+        dispatched = [self._dispatch(batch, now) for batch in due]
+        return [batch for batch in dispatched if batch is not None]
+
+    def dispatch_all(self, now: datetime | None = None) -> list[DeliveryBatch]:
+        """
+        Dispatches every open batch regardless of its time window.
+
+        :param now: the current time. Defaults to datetime.now().
+        :type now: datetime | None
+        :return: the dispatched batches.
+        :rtype: list[DeliveryBatch]
+        """
+        if now is None:
+            now = datetime.now()
+        dispatched = [self._dispatch(batch, now) for batch in list(self._open_batches.values())]
+        return [batch for batch in dispatched if batch is not None]
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves counters describing the effect of batching on dispatched orders.
+
+        :return: a dictionary with the number of dispatched orders and batches, the number of
+        couriers saved compared to one courier per order, and the total and average latency
+        added by batching in minutes.
+        :rtype: dict
+        """
+        average = self._added_latency_minutes / self._orders_dispatched if self._orders_dispatched else 0.0
+        return {
+            "orders_dispatched": self._orders_dispatched,
+            "batches_dispatched": self._batches_dispatched,
+            "couriers_saved": self._orders_dispatched - self._batches_dispatched,
+            "added_latency_minutes": self._added_latency_minutes,
+            "average_added_latency_minutes": average,
+        }
+
+    def _get_location(self, key: str) -> tuple:
+        """
+        Looks up the coordinates of a restaurant address or a client email.
+        """
+        if key not in self._coordinates:
+            raise ValueError(f"No coordinates known for '{key}'.")
+        return self._coordinates[key]
+
+    def _insert(self, batch: DeliveryBatch, order: Order, ready_time: datetime) -> bool:
+        """
+        Inserts the order into the batch route at the position with the shortest detour.
+
+        Returns False without changing the batch if every position would delay some
+        delivery by more than the allowed detour.
+        """
+        origin = self._get_location(batch.get_restaurant().get_address())
+        stops = [self._get_location(batch_order.get_client().get_email()) for batch_order in batch.get_orders()]
+        new_stop = self._get_location(order.get_client().get_email())
+        best_position = None
+        best_cost = None
+        for position in range(len(stops) + 1):
+            previous_stop = stops[position - 1] if position else origin
+            cost = self._get_distance_km(previous_stop, new_stop)
+            if position < len(stops):
+                cost += (self._get_distance_km(new_stop, stops[position])
+                         - self._get_distance_km(previous_stop, stops[position]))
+            if best_cost is not None and cost > best_cost:
+                continue
+            route = stops[:position] + [new_stop] + stops[position:]
+            if self._get_max_detour_km(origin, route) <= self._max_detour_km:
+                best_position = position
+                best_cost = cost
+        if best_position is None:
+            return False
+        batch.insert_order(best_position, order, ready_time)
+        return True
+
+    def _get_max_detour_km(self, origin: tuple, route: list) -> float:
+        """
+        Returns the largest extra distance any stop of the route travels compared to a direct trip.
+        """
+        travelled = 0.0
+        largest = 0.0
+        previous_stop = origin
+        for stop in route:
+            travelled += self._get_distance_km(previous_stop, stop)
+            largest = max(largest, travelled - self._get_distance_km(origin, stop))
+            previous_stop = stop
+        return largest
+
+    def _dispatch(self, batch: DeliveryBatch, dispatch_time: datetime) -> DeliveryBatch | None:
+        """
+        Closes the batch, drops its finished orders, records its statistics and marks the remaining
+        orders as out for delivery. Returns None if no order is left to deliver.
+        """
+        del self._open_batches[batch.get_restaurant()]
+        for order in list(batch.get_orders()):
+            if order.get_status() in ("Delivered", "Cancelled"):
+                batch.remove_order(order)
+        if not batch.get_orders():
+            return None
+        origin = self._get_location(batch.get_restaurant().get_address())
+        travelled = 0.0
+        added_km = 0.0
+        waited_seconds = 0.0
+        previous_stop = origin
+        for order in batch.get_orders():
+            stop = self._get_location(order.get_client().get_email())
+            travelled += self._get_distance_km(previous_stop, stop)
+            added_km += travelled - self._get_distance_km(origin, stop)
+            waited_seconds += max(0.0, (dispatch_time - batch.get_ready_time(order)).total_seconds())
+            previous_stop = stop
+            order.update_status("Out for Delivery")
+        batch.set_route_metrics(travelled, added_km / self._speed_kmh * 60 + waited_seconds / 60)
+        self._orders_dispatched += len(batch.get_orders())
+        self._batches_dispatched += 1
+        self._added_latency_minutes += batch.get_added_latency_minutes()
+        return batch
+
+    @staticmethod
+    def _get_distance_km(first: tuple, second: tuple) -> float:
+        """
+        Computes the great-circle distance between two (latitude, longitude) points in kilometres.
+        """
+        latitude1, longitude1 = map(math.radians, first)
+        latitude2, longitude2 = map(math.radians, second)
+        haversine = (math.sin((latitude2 - latitude1) / 2) ** 2
+                     + math.cos(latitude1) * math.cos(latitude2) * math.sin((longitude2 - longitude1) / 2) ** 2)
+        return 2 * 6371.0 * math.asin(math.sqrt(haversine))
@@ -0,0 +1,248 @@
+import json
+import os
+from array import array
+from datetime import datetime
+
+from .order import Order
+
+class OrderColumnarExporter:
+    """
+    Streams orders and order lines into chunked, column-oriented files for analysis.
+
+    Two tables are written: "orders" (order_number, client_email, restaurant_name, order_time,
+    status, total) and "order_lines" (order_number, item_name, unit_price, quantity). Rows are
+    buffered per column and written out every chunk_rows rows, so memory use does not grow with
+    the number of exported orders. Parquet files are written when pyarrow is installed; otherwise
+    the built-in columnar format is used, which can be read back with read_chunks.
+
+    The built-in format starts with the line "FCOL1". Every chunk is a JSON header line with the
+    number of rows and the name, type and size in bytes of every column, followed by the column
+    data: int64 and float64 values in native byte order, timestamps as int64 microseconds since
+    the epoch, and strings as uint32 UTF-8 lengths followed by the concatenated UTF-8 bytes.
+    """
+    MAGIC = b"FCOL1\n"
+    ORDER_COLUMNS = (("order_number", "int"), ("client_email", "str"), ("restaurant_name", "str"),
+                     ("order_time", "timestamp"), ("status", "str"), ("total", "float"))
+    LINE_COLUMNS = (("order_number", "int"), ("item_name", "str"), ("unit_price", "float"),
+                    ("quantity", "int"))
+
+    def __init__(self, directory: str, chunk_rows: int = 65536, use_arrow: bool | None = None):
+        """
+        Initializes a new OrderColumnarExporter object.
+
+        :param directory: the directory the files are written to. It is created if it does not exist.
+        Must be a non-empty string.
+        :param chunk_rows: the number of rows buffered per table before a chunk is written.
+        Must be a positive integer.
+        :param use_arrow: True to require Parquet output, False to always use the built-in format,
+        None to use Parquet only when pyarrow is installed.
+        :type directory: str
+        :type chunk_rows: int
+        :type use_arrow: bool | None
+        :raises TypeError: if any parameter is not of the expected type.
+        :raises ValueError: if directory is empty, chunk_rows is not positive,
+        or Parquet output is required but pyarrow is not installed.
+        """
+        if not isinstance(directory, str):
+            raise TypeError("Export directory must be a string.")
+        if not directory:
+            raise ValueError("Export directory cannot be empty.")
+        if not isinstance(chunk_rows, int):
+            raise TypeError("Chunk size must be an integer.")
+        if chunk_rows <= 0:
+            raise ValueError("Chunk size must be a positive integer.")
+        if use_arrow is not None and not isinstance(use_arrow, bool):
+            raise TypeError("use_arrow must be a boolean value or None.")
+        arrow = self._load_arrow() if use_arrow is not False else None
+        if use_arrow and arrow is None:
+            raise ValueError("Parquet output requires the pyarrow package.")
+        self._directory = directory
+        self._chunk_rows = chunk_rows
+        self._arrow = arrow
+
+    def get_format(self) -> str:
+        """
+        Retrieves the file format the exporter writes.
+
+        :return: "parquet" or "columnar".
+        :rtype: str
+        """
+        return "parquet" if self._arrow is not None else "columnar"
+
+    def export(self, orders) -> dict:
+        """
+        Exports the orders and their lines, consuming the iterable only once.
+
+        :param orders: an iterable of Order objects, for example a generator.
+        :type orders: Iterable[Order]
+        :return: a dictionary with the format, the paths of the written files and
+        the number of exported orders, order lines and chunks.
+        :rtype: dict
+        :raises TypeError: if the iterable yields an object that is not an Order.
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        extension = "parquet" if self._arrow is not None else "fcol"
+        orders_path = os.path.join(self._directory, f"orders.{extension}")
+        lines_path = os.path.join(self._directory, f"order_lines.{extension}")
+        order_writer = self._open_writer(orders_path, self.ORDER_COLUMNS)
+        line_writer = self._open_writer(lines_path, self.LINE_COLUMNS)
+        order_buffer = [[] for _ in self.ORDER_COLUMNS]
+        line_buffer = [[] for _ in self.LINE_COLUMNS]
+        order_count = 0
+        line_count = 0
+        chunk_count = 0
+        try:
+            for order in orders:
+                if not isinstance(order, Order):
+                    raise TypeError("Can only export Order objects.")
+                order_number = order.get_order_number()
+                total = 0.0
+                for menu_item, quantity in order.get_items().items():
+                    price = menu_item.get_price()
+                    total += price * quantity
+                    for column, value in zip(line_buffer, (order_number, menu_item.get_name(), price, quantity)):
+                        column.append(value)
+                    line_count += 1
+                    if len(line_buffer[0]) >= self._chunk_rows:
+                        self._write_chunk(line_writer, self.LINE_COLUMNS, line_buffer)
+                        chunk_count += 1
+                for column, value in zip(order_buffer, (order_number, order.get_client().get_email(),
+                                                        order.get_restaurant().get_name(), order.get_order_time(),
+                                                        order.get_status(), total)):
+                    column.append(value)
+                order_count += 1
+                if len(order_buffer[0]) >= self._chunk_rows:
+                    self._write_chunk(order_writer, self.ORDER_COLUMNS, order_buffer)
+                    chunk_count += 1
+            for writer, columns, buffer in ((order_writer, self.ORDER_COLUMNS, order_buffer),
+                                            (line_writer, self.LINE_COLUMNS, line_buffer)):
+                if buffer[0]:
+                    self._write_chunk(writer, columns, buffer)
+                    chunk_count += 1
+        finally:
+            order_writer.close()
+            line_writer.close()
+        return {
+            "format": self.get_format(),
+            "orders_path": orders_path,
+            "order_lines_path": lines_path,
+            "orders": order_count,
+            "order_lines": line_count,
+            "chunks": chunk_count,
+        }
+
+    @classmethod
+    def read_chunks(cls, path: str):
+        """
+        Reads a file in the built-in columnar format chunk by chunk.
+
+        :param path: the path of a file written by the built-in format.
+        :type path: str
+        :return: a generator of dictionaries mapping column names to lists of values, one per chunk.
+        :rtype: Iterator[dict]
+        :raises ValueError: if the file is not in the built-in columnar format.
+        """
+        with open(path, "rb") as file:
+            if file.readline() != cls.MAGIC:
+                raise ValueError(f"'{path}' is not a columnar export file.")
+            while True:
+                header_line = file.readline()
+                if not header_line:
+                    return
+                header = json.loads(header_line)
+                rows = header["rows"]
+                chunk = {}
+                for name, column_type, size in header["columns"]:
+                    chunk[name] = cls._decode_column(column_type, rows, file.read(size))
+                yield chunk
+
+    def _open_writer(self, path: str, columns: tuple):
+        """
+        Opens the output file of one table and returns a writer with a close method.
+        """
+        if self._arrow is not None:
+            pyarrow, parquet = self._arrow
+            return parquet.ParquetWriter(path, self._get_arrow_schema(columns))
+        file = open(path, "wb")
+        file.write(self.MAGIC)
+        return file
+
+    def _write_chunk(self, writer, columns: tuple, buffer: list):
+        """
+        Writes the buffered rows of one table as a chunk and empties the buffer.
+        """
+        if self._arrow is not None:
+            pyarrow, parquet = self._arrow
+            schema = self._get_arrow_schema(columns)
+            arrays = [pyarrow.array(values, type=field.type) for field, values in zip(schema, buffer)]
+            writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+        else:
+            encoded = [self._encode_column(column_type, values)
+                       for (_, column_type), values in zip(columns, buffer)]
+            header = {"rows": len(buffer[0]),
+                      "columns": [[name, column_type, len(data)]
+                                  for (name, column_type), data in zip(columns, encoded)]}
+            writer.write(json.dumps(header).encode("utf-8") + b"\n")
+            for data in encoded:
+                writer.write(data)
+        for values in buffer:
+            values.clear()
+
+    def _get_arrow_schema(self, columns: tuple):
+        """
+        Builds the pyarrow schema of one table.
+        """
+        pyarrow, parquet = self._arrow
+        types = {"int": pyarrow.int64(), "float": pyarrow.float64(),
+                 "str": pyarrow.string(), "timestamp": pyarrow.timestamp("us")}
+        return pyarrow.schema([(name, types[column_type]) for name, column_type in columns])
+
+    @staticmethod
+    def _encode_column(column_type: str, values: list) -> bytes:
+        """
+        Encodes the values of one column in the built-in format.
+        """
+        if column_type == "int":
+            return array("q", values).tobytes()
+        if column_type == "float":
+            return array("d", values).tobytes()
+        if column_type == "timestamp":
+            return array("q", [round(value.timestamp() * 1000000) for value in values]).tobytes()
+        encoded = [value.encode("utf-8") for value in values]
+        return array("I", [len(value) for value in encoded]).tobytes() + b"".join(encoded)
+
+    @staticmethod
+    def _decode_column(column_type: str, rows: int, data: bytes) -> list:
+        """
+        Decodes the values of one column written in the built-in format.
+        """
+        if column_type in ("int", "timestamp"):
+            values = array("q")
+            values.frombytes(data)
+            if column_type == "int":
+                return values.tolist()
+            return [datetime.fromtimestamp(value / 1000000) for value in values]
+        if column_type == "float":
+            values = array("d")
+            values.frombytes(data)
+            return values.tolist()
+        lengths = array("I")
+        lengths.frombytes(data[:rows * lengths.itemsize])
+        position = rows * lengths.itemsize
+        strings = []
+        for length in lengths:
+            strings.append(data[position:position + length].decode("utf-8"))
+            position += length
+        return strings
+
+    @staticmethod
+    def _load_arrow():
+        """
+        Imports pyarrow and pyarrow.parquet, returning None if they are not installed.
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            return None
+        return pyarrow, pyarrow.parquet
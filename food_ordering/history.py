@@ -0,0 +1,240 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+
+from .order import Order
+
+class OrderSummary:
+    """
+    Represents a compact summary of an order for history listings: number, restaurant, total, status and time.
+
+    Summaries are stored apart from the full Order objects, so listing past orders never touches
+    the order lines, the client or the restaurant objects.
+    """
+    __slots__ = ("_order_number", "_restaurant_name", "_total", "_status", "_order_time")
+
+    def __init__(self, order_number: int, restaurant_name: str, total: float, status: str, order_time: datetime):
+        """
+        Initializes a new OrderSummary object.
+
+        :param order_number: the unique number of the order.
+        :param restaurant_name: the name of the restaurant that serves the order.
+        :param total: the total price of the order.
+        :param status: the current status of the order.
+        :param order_time: the time when the order was created.
+        :type order_number: int
+        :type restaurant_name: str
+        :type total: float
+        :type status: str
+        :type order_time: datetime
+        """
+        self._order_number = order_number
+        self._restaurant_name = restaurant_name
+        self._total = total
+        self._status = status
+        self._order_time = order_time
+
+    def get_order_number(self) -> int:
+        """
+        Retrieves the unique order number.
+
+        :return: the order number as an integer.
+        :rtype: int
+        """
+        return self._order_number
+    def get_restaurant_name(self) -> str:
+        """
+        Retrieves the name of the restaurant that serves the order.
+
+        :return: the restaurant name as a string.
+        :rtype: str
+        """
+        return self._restaurant_name
+    def get_total(self) -> float:
+        """
+        Retrieves the total price of the order.
+
+        :return: the total price as a float.
+        :rtype: float
+        """
+        return self._total
+    def get_status(self) -> str:
+        """
+        Retrieves the current status of the order.
+
+        :return: the order status as a string.
+        :rtype: str
+        """
+        return self._status
+    def get_order_time(self) -> datetime:
+        """
+        Retrieves the time when the order was created.
+
+        :return: a datetime object representing the order creation time.
+        :rtype: datetime
+        """
+        return self._order_time
+
+    def get_sort_key(self) -> tuple[datetime, int]:
+        """
+        Retrieves the key the summaries of a client are ordered by: order time, then order number.
+
+        :return: a tuple of the order time and the order number.
+        :rtype: tuple[datetime, int]
+        """
+        return self._order_time, self._order_number
+
+    def update(self, total: float, status: str):
+        """
+        Updates the parts of the summary that change during the life of an order.
+
+        :param total: the new total price of the order.
+        :type total: float
+        :param status: the new status of the order.
+        :type status: str
+        """
+        self._total = total
+        self._status = status
+
+    def __str__(self):
+        """
+        Returns a one-line string representation of the OrderSummary object.
+
+        :return: a formatted string with the order number, time, restaurant, status and total.
+        :rtype: str
+        """
+        return (f"Order #{self._order_number} ({self._order_time.strftime('%Y-%m-%d %H:%M:%S')}) "
+                f"from {self._restaurant_name}: {self._status}, ${self._total:.2f}")
+
+class OrderHistoryIndex:
+    """
+    Keeps the order history of every client, ordered by order time, for paginated "my past orders" views.
+
+    The history of each client (identified by email) is an append-only list of OrderSummary objects
+    sorted by order time and order number. Orders are appended when they are created and their
+    summaries are updated in place on status and line changes, through Order.set_history_index.
+    Pages are read newest first with an opaque cursor that encodes the sort key of the last
+    returned order, so a page costs one binary search plus the size of the page.
+    """
+    def __init__(self):
+        """
+        Initializes a new, empty OrderHistoryIndex object.
+        """
+        self._by_client: dict[str, list[OrderSummary]] = {}
+        self._by_number: dict[int, OrderSummary] = {}
+
+    def get_order_count(self) -> int:
+        """
+        Retrieves the number of orders in the index.
+
+        :return: the number of indexed orders as an integer.
+        :rtype: int
+        """
+        return len(self._by_number)
+
+    def add_order(self, order: Order):
+        """
+        Adds a summary of the order to the history of its client.
+
+        :param order: the Order object to add.
+        :type order: Order
+        :raises TypeError: if order is not an Order object.
+        """
+        if not isinstance(order, Order):
+            raise TypeError("Can only index Order objects.")
+        summary = OrderSummary(order.get_order_number(), order.get_restaurant().get_name(),
+                               order.get_total_price(), order.get_status(), order.get_order_time())
+        self.add_summary(order.get_client().get_email(), summary)
+
+    def add_summary(self, client_email: str, summary: OrderSummary):
+        """
+        Adds an order summary to the history of a client, for example one loaded from storage.
+
+        :param client_email: the email of the client the order belongs to.
+        :type client_email: str
+        :param summary: the OrderSummary object to add.
+        :type summary: OrderSummary
+        :raises TypeError: if summary is not an OrderSummary object.
+        :raises ValueError: if an order with the same number is already indexed.
+        """
+        if not isinstance(summary, OrderSummary):
+            raise TypeError("Can only add OrderSummary objects.")
+        if summary.get_order_number() in self._by_number:
+            raise ValueError(f"Order {summary.get_order_number()} is already indexed.")
+        history = self._by_client.setdefault(client_email, [])
+        if not history or history[-1].get_sort_key() <= summary.get_sort_key():
+            history.append(summary)
+        else:
+            insort(history, summary, key=OrderSummary.get_sort_key)
+        self._by_number[summary.get_order_number()] = summary
+
+    def update_order(self, order: Order):
+        """
+        Refreshes the total and status stored in the summary of an indexed order.
+
+        Orders that are not in the index are ignored.
+
+        :param order: the Order object that changed.
+        :type order: Order
+        """
+        summary = self._by_number.get(order.get_order_number())
+        if summary is not None:
+            summary.update(order.get_total_price(), order.get_status())
+
+    def get_summary(self, order_number: int) -> OrderSummary | None:
+        """
+        Retrieves the summary of an order by its number.
+
+        :param order_number: the number of the order.
+        :type order_number: int
+        :return: the OrderSummary object, or None if the order is not indexed.
+        :rtype: OrderSummary | None
+        """
+        return self._by_number.get(order_number)
+
+    def get_page(self, client_email: str, limit: int = 20,
+                 cursor: str | None = None) -> tuple[list[OrderSummary], str | None]:
+        """
+        Retrieves one page of a client's order history, newest orders first.
+
+        :param client_email: the email of the client.
+        :type client_email: str
+        :param limit: the maximum number of orders on the page. Must be a positive integer.
+        :type limit: int
+        :param cursor: the cursor returned with the previous page, or None for the first page.
+        :type cursor: str | None
+        :return: the summaries on the page and the cursor of the next page, or None if this is the last page.
+        :rtype: tuple[list[OrderSummary], str | None]
+        :raises TypeError: if limit is not an integer.
+        :raises ValueError: if limit is not positive or the cursor is malformed.
+        """
+        if not isinstance(limit, int):
+            raise TypeError("Page limit must be an integer.")
+        if limit <= 0:
+            raise ValueError("Page limit must be a positive integer.")
+        history = self._by_client.get(client_email, [])
+        end = len(history)
+        if cursor is not None:
+            end = bisect_left(history, self._decode_cursor(cursor), key=OrderSummary.get_sort_key)
+        start = max(0, end - limit)
+        page = history[start:end]
+        page.reverse()
+        next_cursor = self._encode_cursor(page[-1]) if start > 0 else None
+        return page, next_cursor
+
+    @staticmethod
+    def _encode_cursor(summary: OrderSummary) -> str:
+        """
+        Encodes the sort key of a summary as a cursor string.
+        """
+        return f"{summary.get_order_time().isoformat()}|{summary.get_order_number()}"
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+        """
+        Decodes a cursor string back into a sort key.
+        """
+        try:
+            order_time, order_number = cursor.split("|")
+            return datetime.fromisoformat(order_time), int(order_number)
+        except (AttributeError, ValueError):
+            raise ValueError("Invalid history cursor.") from None
@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .client import Client
+from .order import Order
+from .restaurant import Restaurant
+
+class OrderIdempotencyCache:
+    """
+    Deduplicates order submissions by a client-supplied idempotency key.
+
+    The cache maps each key, scoped to the email of the client that sent it, to the order it
+    created. A retried submission with the same key returns the original order in O(1) without
+    validating or adding its lines again. The number of remembered keys is bounded: the least
+    recently used key is evicted when the cache is full, and keys older than the time-to-live
+    are treated as unknown.
+
+    The cache lock is held only to look up and store entries. Orders are built outside of it,
+    under a lock of their key, so submissions with different keys never wait for each other
+    while concurrent retries of one key still create a single order.
+    """
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 86400.0):
+        """
+        Initializes a new, empty OrderIdempotencyCache object.
+
+        :param max_entries: the maximum number of keys remembered at once. Must be a positive integer.
+        :param ttl_seconds: how long a key is remembered after its order was created. Must be a positive float.
+        :type max_entries: int
+        :type ttl_seconds: float
+        :raises TypeError: if any parameter is not of the expected type.
+        :raises ValueError: if any parameter is not positive.
+        """
+        if not isinstance(max_entries, int):
+            raise TypeError("Maximum number of entries must be an integer.")
+        if max_entries <= 0:
+            raise ValueError("Maximum number of entries must be a positive integer.")
+        if not isinstance(ttl_seconds, float):
+            raise TypeError("Time-to-live must be a float.")
+        if ttl_seconds <= 0:
+            raise ValueError("Time-to-live must be a positive number of seconds.")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[Order, float]] = OrderedDict()
+        self._key_locks: dict[tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def create_order(self, idempotency_key: str, client: Client, restaurant: Restaurant,
+                     items: dict | None = None) -> Order:
+        """
+        Creates an order for the key, or returns the order the same client already created with it.
+
+        The lines are validated and reserved before the order is created, so a submission that
+        cannot be fulfilled creates no order and is not remembered, and the client can retry it.
+
+        :param idempotency_key: the key the client sends with every attempt of the same submission.
+        Must be a non-empty string.
+        :param client: the Client object placing the order.
+        :param restaurant: the Restaurant object from which the order is placed.
+        :param items: a dictionary mapping MenuItem objects to quantities to add to a new order.
+        :type idempotency_key: str
+        :type client: Client
+        :type restaurant: Restaurant
+        :type items: dict[MenuItem, int] | None
+        :return: the new Order object, or the original one if the client used the key before.
+        :rtype: Order
+        :raises TypeError: if idempotency_key is not a string, client is not a Client object,
+        items is not a dictionary or the order cannot be created.
+        :raises ValueError: if idempotency_key is empty, was already used by the client for an order
+        from another restaurant, or the order cannot be created.
+        """
+        if not isinstance(idempotency_key, str):
+            raise TypeError("Idempotency key must be a string.")
+        if not idempotency_key:
+            raise ValueError("Idempotency key cannot be empty.")
+        if not isinstance(client, Client):
+            raise TypeError("Order must be associated with a valid Client.")
+        if items is not None and not isinstance(items, dict):
+            raise TypeError("Order items must be a dict.")
+        cache_key = (client.get_email(), idempotency_key)
+        with self._lock:
+            order = self._lookup(cache_key, restaurant)
+            if order is not None:
+                return order
+            key_lock = self._key_locks.get(cache_key)
+            if key_lock is None:
+                key_lock = self._key_locks[cache_key] = [threading.Lock(), 0]
+            key_lock[1] += 1
+        try:
+            with key_lock[0]:
+                with self._lock:
+                    order = self._lookup(cache_key, restaurant)
+                    if order is not None:
+                        return order
+                    self._misses += 1
+                order = Order(client, restaurant, items)
+                with self._lock:
+                    self._entries[cache_key] = (order, time.monotonic() + self._ttl_seconds)
+                    if len(self._entries) > self._max_entries:
+                        self._entries.popitem(last=False)
+                        self._evictions += 1
+                return order
+        finally:
+            with self._lock:
+                key_lock[1] -= 1
+                if not key_lock[1]:
+                    del self._key_locks[cache_key]
+
+    def get_order(self, idempotency_key: str, client: Client) -> Order | None:
+        """
+        Retrieves the order a client created with the key without creating a new one.
+
+        :param idempotency_key: the idempotency key to look up.
+        :type idempotency_key: str
+        :param client: the Client object that sent the key.
+        :type client: Client
+        :return: the Order object created for the key, or None if the key is unknown or expired.
+        :rtype: Order | None
+        """
+        with self._lock:
+            entry = self._entries.get((client.get_email(), idempotency_key))
+            if entry is None or entry[1] <= time.monotonic():
+                return None
+            return entry[0]
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the memory bounds of the cache and counters of its activity.
+
+        :return: a dictionary with the current and maximum number of entries, the time-to-live,
+        and the number of hits, misses, evictions and expirations.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def _lookup(self, cache_key: tuple[str, str], restaurant: Restaurant) -> Order | None:
+        """
+        Returns the live order stored for the key and counts the hit, or drops an expired entry.
+        Must be called under the cache lock.
+        """
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        order, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[cache_key]
+            self._expirations += 1
+            return None
+        if order.get_restaurant() is not restaurant:
+            raise ValueError("Idempotency key was already used for an order from another restaurant.")
+        self._entries.move_to_end(cache_key)
+        self._hits += 1
+        return order
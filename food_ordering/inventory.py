@@ -0,0 +1,118 @@
+import threading
+
+from .menu_item import MenuItem
+
+class Inventory:
+    """
+    Tracks how many portions of each dish a restaurant can still sell.
+
+    Orders reserve portions when dishes are added and release them when dishes are removed or
+    the order is cancelled. Every check-and-decrement happens under one lock, so concurrent
+    orders can never reserve more portions than are in stock. A dish becomes unavailable when
+    its stock reaches zero and available again when portions are released or restocked.
+    Dishes without a stock entry are not tracked and can be ordered without limit.
+    """
+    def __init__(self):
+        """
+        Initializes a new, empty Inventory object.
+        """
+        self._stock: dict[MenuItem, int] = {}
+        self._lock = threading.Lock()
+
+    def get_stock(self, menu_item: MenuItem) -> int | None:
+        """
+        Retrieves the number of portions of a dish left in stock.
+
+        :param menu_item: the MenuItem object to look up.
+        :type menu_item: MenuItem
+        :return: the number of portions left, or None if the dish is not tracked.
+        :rtype: int | None
+        """
+        return self._stock.get(menu_item)
+
+    def set_stock(self, menu_item: MenuItem, portions: int):
+        """
+        Sets the number of portions of a dish in stock and updates its availability.
+
+        :param menu_item: the MenuItem object to track.
+        :type menu_item: MenuItem
+        :param portions: the number of portions in stock. Must be a non-negative integer.
+        :type portions: int
+        :raises TypeError: if menu_item is not a MenuItem object or portions is not an integer.
+        :raises ValueError: if portions is negative.
+        """
+        if not isinstance(menu_item, MenuItem):
+            raise TypeError("Can only track stock of MenuItem objects.")
+        if not isinstance(portions, int):
+            raise TypeError("Stock must be an integer.")
+        if portions < 0:
+            raise ValueError("Stock cannot be negative.")
+        with self._lock:
+            self._stock[menu_item] = portions
+            menu_item.set_is_available(portions > 0)
+
+    def reserve(self, menu_item: MenuItem, quantity: int) -> bool:
+        """
+        Atomically takes portions of a dish out of stock.
+
+        :param menu_item: the MenuItem object to reserve.
+        :type menu_item: MenuItem
+        :param quantity: the number of portions to reserve.
+        :type quantity: int
+        :return: True if the portions were reserved or the dish is not tracked,
+        False if there are not enough portions left.
+        :rtype: bool
+        """
+        with self._lock:
+            portions = self._stock.get(menu_item)
+            if portions is None:
+                return True
+            if portions < quantity:
+                return False
+            self._stock[menu_item] = portions - quantity
+            if portions == quantity:
+                menu_item.set_is_available(False)
+            return True
+
+    def reserve_lines(self, lines: dict[MenuItem, int]) -> dict[MenuItem, int] | None:
+        """
+        Atomically reserves portions of several dishes: either every line is reserved or none is.
+
+        :param lines: a dictionary mapping each MenuItem to the number of portions to reserve.
+        :type lines: dict[MenuItem, int]
+        :return: the lines actually taken out of stock, without the dishes that are not tracked,
+        or None if any tracked dish does not have enough portions left.
+        :rtype: dict[MenuItem, int] | None
+        """
+        with self._lock:
+            taken = {}
+            for menu_item, quantity in lines.items():
+                portions = self._stock.get(menu_item)
+                if portions is None:
+                    continue
+                if portions < quantity:
+                    return None
+                taken[menu_item] = quantity
+            for menu_item, quantity in taken.items():
+                portions = self._stock[menu_item]
+                self._stock[menu_item] = portions - quantity
+                if portions == quantity:
+                    menu_item.set_is_available(False)
+            return taken
+
+    def release(self, menu_item: MenuItem, quantity: int):
+        """
+        Atomically returns previously reserved portions of a dish to stock.
+
+        :param menu_item: the MenuItem object to release.
+        :type menu_item: MenuItem
+        :param quantity: the number of portions to return.
+        :type quantity: int
+        """
+        with self._lock:
+            portions = self._stock.get(menu_item)
+            if portions is None:
+                return
+            self._stock[menu_item] = portions + quantity
+            if portions == 0 and quantity > 0:
+                menu_item.set_is_available(True)
@@ -0,0 +1,173 @@
+import threading
+from typing import TYPE_CHECKING
+
+from .menu_item import MenuItem
+
+if TYPE_CHECKING:
+    from .search import MenuSearchIndex
+
+class Menu:
+    """
+    This class represents a restaurant's menu, holding a collection of menu items (dishes).
+
+    It allows for the creation, management, and display of the dishes available on a specific menu.
+    It provides functionality for adding, removing, and searching for individual menu items.
+
+    The items are kept in an immutable tuple that is never modified in place. Writers build
+    a new version of the tuple and publish it with a single reference assignment, so readers
+    always see a consistent snapshot without taking a lock.
+    """
+    def __init__(self, name: str):
+        """
+        Initializes a new Menu object.
+
+        Sets the name of the menu and creates an empty snapshot to store MenuItem objects.
+
+        :param name: the name of the menu (for example, "Breakfasts", "Lunch Menu").
+        :type name: str
+        :raises TypeError: if name is not a string.
+        :raises ValueError: if name is an empty string.
+        """
+        if not isinstance(name, str):
+            raise TypeError("Menu name must be a string.")
+        if not name:
+            raise ValueError("Menu name cannot be empty.")
+        self._name = name
+        self._items: tuple[MenuItem, ...] = ()
+        self._version = 0
+        self._write_lock = threading.Lock()
+        self._search_index: "MenuSearchIndex | None" = None
+
+    def get_name(self) -> str:
+        """
+        Retrieves the name of the menu.
+
+        :return: the name of the menu as a string.
+        :rtype: str
+        """
+        return self._name
+
+    def get_version(self) -> int:
+        """
+        Retrieves the version number of the menu, increased on every change of its items.
+
+        :return: the version of the menu as an integer.
+        :rtype: int
+        """
+        return self._version
+
+    def get_items(self) -> tuple[MenuItem, ...]:
+        """
+        Retrieves a consistent snapshot of the items on the menu.
+
+        The returned tuple is never modified by later changes to the menu,
+        so it can be iterated safely while other threads edit the menu.
+
+        :return: a tuple of the MenuItem objects on the menu.
+        :rtype: tuple[MenuItem, ...]
+        """
+        return self._items
+
+    def add_item(self, item: MenuItem):
+        """
+        Adds a MenuItem object to the menu.
+
+        This method publishes a new snapshot of the items that ends with the provided MenuItem.
+        It ensures that only valid MenuItem objects can be added.
+
+        :param item: the MenuItem object to be added to the menu.
+        :type item: MenuItem
+        :raises TypeError: if the provided item is not an instance of MenuItem.
+        """
+        if not isinstance(item, MenuItem):
+            raise TypeError("Can only add MenuItem objects to the menu.")
+        with self._write_lock:
+            self._items = self._items + (item,)
+            self._version += 1
+            if self._search_index is not None:
+                self._search_index.add_item(self, item)
+
+    def remove_item(self, item_name: str):
+        """
+        Removes a MenuItem from the menu by its name.
+
+        This method iterates through the current snapshot of menu items and
+        publishes a new snapshot excluding the item with the matching name.
+        If multiple items have the same name, all will be removed.
+
+        :param item_name: the name of the menu item to be removed.
+        :type item_name: str
+        """
+        with self._write_lock:
+            new_items_list = []
+            for item in self._items:
+                if item.get_name() != item_name:
+                    new_items_list.append(item)
+            self._items = tuple(new_items_list)
+            self._version += 1
+            if self._search_index is not None:
+                self._search_index.remove_item(self, item_name)
+
+    def get_item(self, item_name: str) -> MenuItem | None:
+        """
+        Retrieves a MenuItem from the menu by its name.
+
+        This method searches for an item with the specified name within the menu.
+        It returns the first matching MenuItem object found.
+
+        :param item_name: the name of the menu item to retrieve.
+        :type item_name: str
+        :return: the MenuItem object if found, otherwise None.
+        :rtype: MenuItem | None
+        """
+        for item in self._items:
+            if item.get_name() == item_name:
+                return item
+        return None
+
+    def get_search_index(self) -> "MenuSearchIndex | None":
+        """
+        Retrieves the search index this menu reports its changes to.
+
+        :return: the MenuSearchIndex attached to the menu, or None if no index is set.
+        :rtype: MenuSearchIndex | None
+        """
+        return self._search_index
+
+    def set_search_index(self, search_index: "MenuSearchIndex"):
+        """
+        Attaches the menu to a search index.
+
+        All items already on the menu are indexed immediately, and every later call
+        to add_item or remove_item keeps the index up to date.
+
+        :param search_index: the MenuSearchIndex that should index this menu.
+        :type search_index: MenuSearchIndex
+        :raises TypeError: if search_index is not an instance of MenuSearchIndex.
+        :raises ValueError: if the menu is already attached to a search index.
+        """
+        from .search import MenuSearchIndex
+
+        if not isinstance(search_index, MenuSearchIndex):
+            raise TypeError("Search index must be an instance of the MenuSearchIndex class.")
+        with self._write_lock:
+            if self._search_index is not None:
+                raise ValueError("Menu is already attached to a search index.")
+            self._search_index = search_index
+            for item in self._items:
+                search_index.add_item(self, item)
+
+    def display_menu(self):
+        """
+        Prints a formatted display of the entire menu to the console.
+
+        This method first prints the menu's name, then lists all the items it contains.
+        If the menu is empty, it indicates that no items are available.
+        Each item's details are displayed using its __str__ method.
+        """
+        items = self.get_items()
+        print(f"{self.get_name()}")
+        if not items:
+            print("No items in this menu yet.")
+        for item in items:
+            print(item)
@@ -0,0 +1,160 @@
+class MenuItem:
+    """
+    Class MenuItem is designed to represent an individual item or dish on a menu, responsible for both storing
+    and validating its detailed attributes.
+
+    Within the MenuItem class, the parameters are internal variables that store the values
+    of a specific dish. These are defined in the __init__ constructor.
+    """
+    def __init__(self, name: str, description: str, price: float, calories: int, weight_gram: float,
+                 allergens: list, is_available: bool, preparation_time_minutes: int):
+        """
+        The __init__ method initializes a dish object, checking the validity
+        of the input values for the name, description, price, calories,
+        weight in grams, allergens, availability, and cooking time in minutes.
+
+        :param name: the name of the dish. Must be a non-empty string.
+        :param description: a detailed description of the dish. Must be a non-empty string.
+        :param price: the price of the dish. Must be a positive float.
+        :param calories: the caloric content of the dish. Must be a positive integer.
+        :param weight_gram: the weight of the dish in grams. Must be a positive float.
+        :param allergens: a list of allergens present in the dish. Must be a non-empty list.
+        :param is_available: a boolean indicating if the dish is currently available.
+        :param preparation_time_minutes: the estimated preparation time in minutes. Must be a positive integer.
+        :raises TypeError: if any parameter is not of the expected type.
+        :raises ValueError: if any parameter fails validation (for example empty string, non-positive number, empty list).
+        """
+        if not isinstance(name, str):
+            raise TypeError("The dish name cannot be non-string.")
+        if not isinstance(description, str):
+            raise TypeError("The dish description must be a string.")
+        if not description:
+            raise ValueError("The description name cannot be empty.")
+        if not isinstance(price, float):
+            raise TypeError("The dish price must be of type float.")
+        if price <= 0:
+            raise ValueError("The price of the dish needs to be a positive value.")
+        if not isinstance(calories, int):
+            raise TypeError("Calories must be a type integer.")
+        if calories <= 0:
+            raise ValueError("Calories must be a positive integer.")
+        if not isinstance(weight_gram, float):
+            raise TypeError("Weight must be a type float.")
+        if weight_gram <= 0:
+            raise ValueError("Weight must be a positive number in grams.")
+        if not isinstance(allergens, list):
+            raise TypeError("Allergens must be provided as a list.")
+        if not allergens:
+            raise ValueError("Allergens list cannot be empty.")
+        if not isinstance(is_available, bool):
+            raise TypeError("Availability must be a boolean value.")
+        if not isinstance(preparation_time_minutes, int):
+            raise TypeError("Preparation time must be an integer.")
+        if preparation_time_minutes <= 0:
+            raise ValueError("Preparation time must be a positive integer.")
+        self._name = name
+        self._description = description
+        self._price = price
+        self._calories = calories
+        self._weight_gram = weight_gram
+        self._allergens = allergens
+        self._is_available = is_available
+        self._preparation_time_minutes = preparation_time_minutes
+
+    def get_name(self) -> str:
+        """
+        Retrieves the name of the menu item.
+
+        :return: the name of the dish as a string.
+        :rtype: str
+        """
+        return self._name
+    def get_description(self) -> str:
+        """
+        Retrieves the detailed description of the menu item.
+
+        :return: the description of the dish as a string.
+        :rtype: str
+        """
+        return self._description
+    def get_price(self) -> float:
+        """
+        Retrieves the price of the menu item.
+
+        :return: the price of the dish as a float.
+        :rtype: float
+        """
+        return self._price
+    def get_calories(self) -> int:
+        """
+        Retrieves the caloric content of the menu item.
+
+        :return: the calories of the dish as an integer.
+        :rtype: int
+        """
+        return self._calories
+    def get_weight_gram(self) -> float:
+        """
+        Retrieves the weight of the menu item in grams.
+
+        :return: the weight of the dish in grams as a float.
+        :rtype: float
+        """
+        return self._weight_gram
+    def get_allergens(self) -> list:
+        """
+        Retrieves the list of allergens present in the menu item.
+
+        :return: a list of allergens as strings.
+        :rtype: list
+        """
+        return self._allergens
+    def get_is_available(self) -> bool:
+        """
+        Checks the current availability status of the menu item.
+
+        :return: true if the dish is available, False otherwise.
+        :rtype: bool
+        """
+        return self._is_available
+    def set_is_available(self, is_available: bool):
+        """
+        Changes the availability status of the menu item, for example when it sells out.
+
+        :param is_available: True if the dish can be ordered, False otherwise.
+        :type is_available: bool
+        :raises TypeError: if is_available is not a boolean value.
+        """
+        if not isinstance(is_available, bool):
+            raise TypeError("Availability must be a boolean value.")
+        self._is_available = is_available
+    def get_preparation_time_minutes(self) -> int:
+        """
+        Retrieves the estimated preparation time for the menu item in minutes.
+
+        :return: the preparation time in minutes as an integer.
+        :rtype: int
+        """
+        return self._preparation_time_minutes
+
+    def __str__(self):
+        """
+        Returns a string representation of the MenuItem object, including all its key attributes
+        in a readable and formatted manner.
+
+        This method allows for easy output of dish information, for example, for printing a menu
+        or for logging purposes.
+
+        :return: a formatted string representation of the MenuItem object.
+        :rtype: str
+        """
+        availability_status = "Available" if self._is_available else "Not Available"
+        return (f"\n"
+                f"Dish Name: {self._name}\n"
+                f"Description: {self._description}\n"
+                f"Price: ${self._price:.2f}\n"
+                f"Calories: {self._calories} kcal\n"
+                f"Weight: {self._weight_gram:.2f} grams\n"
+                f"Allergens: {', '.join(self._allergens)}\n"
+                f"Availability: {availability_status}\n"
+                f"Preparation time: {self._preparation_time_minutes} minutes")
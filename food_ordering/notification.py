@@ -0,0 +1,91 @@
+from datetime import datetime
+
+class Notification:
+    """
+    Represents a notification to be sent, typically for order updates or promotional messages.
+    Manages the message content, recipient, type, and tracks when it was sent.
+    """
+    def __init__(self, message: str, recipient_email: str, notification_type: str = "Email"):
+        """
+        Initializes a new Notification object.
+
+        Validates the message content, recipient email, and notification type
+        to ensure proper delivery.
+
+        :param message: the content of the notification.
+        :param recipient_email: the email address to which the notification will be sent.
+        Must contain @.
+        :param notification_type: the type of notification (for example, "Email", "SMS"). Defaults to "Email".
+        :type message: str
+        :type recipient_email: str
+        :type notification_type: str
+        :raises TypeError: if 'message', 'recipient_email', or 'notification_type' are not strings.
+        :raises ValueError: if 'message' or 'recipient_email' are empty, or if 'recipient_email' is not a valid email format.
+        """
+        if not isinstance(message, str):
+            raise TypeError("Notification message must be a string.")
+        if not message:
+            raise ValueError("Notification message cannot be empty.")
+        if not isinstance(recipient_email, str):
+            raise TypeError("Recipient email must be a string.")
+        if "@" not in recipient_email:
+            raise ValueError("Recipient email must be a valid email string.")
+        if not isinstance(notification_type, str):
+            raise TypeError("Notification type must be a string.")
+        self._message = message
+        self._recipient_email = recipient_email
+        self._notification_type = notification_type
+        self._sent_time = None
+        self._header: str | None = None
+
+    def get_message(self) -> str:
+        """
+        Retrieves the content of the notification message.
+
+        :return: the notification message as a string.
+        :rtype: str
+        """
+        return self._message
+    def get_recipient_email(self) -> str:
+        """
+        Retrieves the email address of the notification's recipient.
+
+        :return: the recipient's email address as a string.
+        :rtype: str
+        """
+        return self._recipient_email
+    def get_notification_type(self) -> str:
+        """
+        Retrieves the type of the notification (for example, "Email", "SMS").
+
+        :return: the notification type as a string.
+        :rtype: str
+        """
+        return self._notification_type
+    def get_sent_time(self) -> datetime | None:
+        """
+        Retrieves the timestamp when the notification was sent.
+
+        :return: a datetime object if the notification has been sent, otherwise None.
+        :rtype: datetime | None
+        """
+        return self._sent_time
+
+    def send(self):
+        """
+        Simulates sending the notification and records time.
+
+        This method updates the internal '_sent_time' attribute to the current datetime
+        and returns a formatted string detailing the notification and its sending time.
+        The part of the string that does not depend on the time is formatted on the first
+        call only and reused afterwards.
+
+        :return: a multi-line string confirming the notification details and send time.
+        :rtype: str
+        """
+        self._sent_time = datetime.now()
+        if self._header is None:
+            self._header = (f"Sending {self.get_notification_type()} notification\n"
+                            f"To: {self.get_recipient_email()}\n"
+                            f"Message: {self.get_message()}\n")
+        return f"{self._header}Sent at: {self.get_sent_time().strftime('%Y-%m-%d %H:%M:%S')}\n"
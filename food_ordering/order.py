@@ -0,0 +1,268 @@
+from datetime import datetime
+
+from .client import Client
+from .menu_item import MenuItem
+from .restaurant import Restaurant
+
+class Order:
+    """
+    Represents a customer order within the restaurant system.
+    Manages order details including items, total price, status, and associated client and restaurant.
+    If a history index is set with set_history_index, every new order and every change of its
+    lines or status is reported to it.
+    """
+    next_order_number = 0
+    history_index = None
+    def __init__(self, client: Client, restaurant: Restaurant, items: dict | None = None):
+        """
+        Initializes a new Order object.
+
+        Assigns a unique order number, associates the order with a specific client and restaurant,
+        sets the initial status to Pending, and records the current time as the order time.
+        Initial lines given in items are validated and reserved in the restaurant's inventory all
+        at once before the order gets its number, so an order that cannot be fulfilled is never created.
+
+        :param client: the Client object placing the order. Must be an instance of the Client class.
+        :param restaurant: the Restaurant object from which the order is placed. Must be an instance of the Restaurant class.
+        :param items: a dictionary mapping MenuItem objects to the quantities the order starts with, or None.
+        :type client: Client
+        :type restaurant: Restaurant
+        :type items: dict[MenuItem, int] | None
+        :raises TypeError: if client is not a Client object, restaurant is not a Restaurant object,
+        items is not a dictionary or one of its lines has the wrong types.
+        :raises ValueError: if a line has a non-positive quantity, a dish that is not available,
+        or not enough portions in stock.
+        """
+        if not isinstance(client, Client):
+            raise TypeError("Order must be associated with a valid Client.")
+        if not isinstance(restaurant, Restaurant):
+            raise TypeError("Order must be associated with a valid Restaurant.")
+        if items is not None and not isinstance(items, dict):
+            raise TypeError("Order items must be a dict.")
+        self._items: dict[MenuItem, int] = dict(items or {})
+        self._reserved: dict[MenuItem, int] = {}
+        for menu_item, quantity in self._items.items():
+            self._validate_line(menu_item, quantity)
+        inventory = restaurant.get_inventory()
+        if self._items and inventory is not None:
+            taken = inventory.reserve_lines(self._items)
+            if taken is None:
+                raise ValueError("Not enough portions in stock for the order.")
+            self._reserved = taken
+        self._order_number = Order.next_order_number
+        Order.next_order_number += 1
+        self._client = client
+        self._restaurant = restaurant
+        self._order_time = datetime.now()
+        self._status = "Pending"
+        if Order.history_index is not None:
+            Order.history_index.add_order(self)
+        for menu_item, quantity in self._items.items():
+            print(f"Added {quantity} x {menu_item.get_name()} to order {self.get_order_number()}.")
+
+    @classmethod
+    def set_history_index(cls, history_index):
+        """
+        Assigns the OrderHistoryIndex that all orders report their creation and changes to.
+
+        :param history_index: the OrderHistoryIndex object to report to, or None to stop reporting.
+        :type history_index: OrderHistoryIndex | None
+        :raises TypeError: if history_index is neither an OrderHistoryIndex object nor None.
+        """
+        from .history import OrderHistoryIndex
+
+        if history_index is not None and not isinstance(history_index, OrderHistoryIndex):
+            raise TypeError("History index must be an instance of the OrderHistoryIndex class.")
+        cls.history_index = history_index
+
+    def get_order_number(self) -> int:
+        """
+        Retrieves the unique order number.
+
+        :return: the integer order number.
+        :rtype: int
+        """
+        return self._order_number
+    def get_client(self) -> Client:
+        """
+        Retrieves the Client object associated with this order.
+
+        :return: the Client object who placed the order.
+        :rtype: Client
+        """
+        return self._client
+    def get_restaurant(self) -> Restaurant:
+        """
+        Retrieves the Restaurant object from which this order was placed.
+
+        :return: the Restaurant object serving the order.
+        :rtype: Restaurant
+        """
+        return self._restaurant
+    def get_order_time(self) -> datetime:
+        """
+        Retrieves the exact date and time when the order was created.
+
+        :return: a datetime object representing the order creation time.
+        :rtype: datetime
+        """
+        return self._order_time
+    def get_status(self) -> str:
+        """
+        Retrieves the current status of the order.
+
+        :return: the order's status (for example, "Pending", "Confirmed", "Delivered") as a string.
+        :rtype: str
+        """
+        return self._status
+    def get_items(self) -> dict[MenuItem, int]:
+        """
+        Retrieves the lines of the order.
+
+        :return: a copy of the dictionary mapping each MenuItem in the order to its quantity.
+        :rtype: dict[MenuItem, int]
+        """
+        return dict(self._items)
+
+    def add_item(self, menu_item: MenuItem, quantity: int):
+        """
+        Adds a specified quantity of a MenuItem to the order.
+
+        If the item is already in the order, its quantity will be updated.
+        Otherwise, the item will be added with the given quantity.
+        If the restaurant has an inventory, the portions are reserved from its stock.
+        Cancelled and delivered orders cannot be changed.
+
+        :param menu_item: the MenuItem object to add.
+        :type menu_item: MenuItem
+        :param quantity: the number of units of the MenuItem to add. Must be a positive integer.
+        :type quantity: int
+        :raises TypeError: if menu_item is not a MenuItem object or quantity is not an integer.
+        :raises ValueError: if quantity is not a positive integer, the order is cancelled or delivered,
+        or the dish is not available or does not have enough portions in stock.
+        """
+        self._validate_line(menu_item, quantity)
+        if self._status in ("Cancelled", "Delivered"):
+            raise ValueError(f"Cannot add items to a {self._status.lower()} order.")
+        inventory = self._restaurant.get_inventory()
+        if inventory is not None:
+            taken = inventory.reserve_lines({menu_item: quantity})
+            if taken is None:
+                raise ValueError(f"Not enough {menu_item.get_name()} in stock.")
+            if taken:
+                self._reserved[menu_item] = self._reserved.get(menu_item, 0) + quantity
+        if menu_item in self._items:
+            self._items[menu_item] += quantity
+        else:
+            self._items[menu_item] = quantity
+        if Order.history_index is not None:
+            Order.history_index.update_order(self)
+        print(f"Added {quantity} x {menu_item.get_name()} to order {self.get_order_number()}.")
+
+    @staticmethod
+    def _validate_line(menu_item: MenuItem, quantity: int):
+        """
+        Checks that a line names an available MenuItem and a positive integer quantity.
+        """
+        if not isinstance(menu_item, MenuItem):
+            raise TypeError("Can only add MenuItem objects to an order.")
+        if not isinstance(quantity, int):
+            raise TypeError("Quantity must be a integer.")
+        if quantity <= 0:
+            raise ValueError("Quantity must be a positive integer.")
+        if not menu_item.get_is_available():
+            raise ValueError(f"{menu_item.get_name()} is not available.")
+
+    def remove_item(self, menu_item: MenuItem):
+        """
+        Removes a specific MenuItem entirely from the order.
+
+        If the item is not found in the order, a message indicating this is printed.
+        Portions the order holds in the restaurant's inventory are returned to stock.
+
+        :param menu_item: the MenuItem object to remove from the order.
+        :type menu_item: MenuItem
+        """
+        if menu_item in self._items:
+            del self._items[menu_item]
+            reserved = self._reserved.pop(menu_item, 0)
+            inventory = self._restaurant.get_inventory()
+            if inventory is not None and reserved:
+                inventory.release(menu_item, reserved)
+            if Order.history_index is not None:
+                Order.history_index.update_order(self)
+            print(f"Removed {menu_item.get_name()} from order {self.get_order_number()}.")
+        else:
+            print(f"{menu_item.get_name()} not found in order {self.get_order_number()}.")
+
+    def get_total_price(self) -> float:
+        """
+        Calculates and returns the total price of all items in the order.
+
+        :return: the total price of the order as a float.
+        :rtype: float
+        """
+        total = 0.0
+        for item, quantity in self._items.items():
+            total += item.get_price() * quantity
+        return total
+
+    def update_status(self, new_status: str):
+        """
+        Updates the status of the order.
+
+        The new status must be one of the predefined valid statuses.
+        When an order is cancelled, the portions it holds are returned to the restaurant's inventory.
+        When a cancelled order is reopened, all of its lines are reserved again in one step.
+        Delivered portions are consumed, so a delivered order no longer holds any and cannot be cancelled.
+
+        :param new_status: the new status for the order (for example, "Confirmed", "Delivered").
+        Valid statuses: "Pending", "Confirmed", "Preparing", "Out for Delivery", "Delivered", "Cancelled".
+        :type new_status: str
+        :raises ValueError: if the new_status is not one of the allowed values, a delivered order
+        is cancelled, or a cancelled order is reopened and its lines do not have enough portions in stock.
+        """
+        valid_statuses = ["Pending", "Confirmed", "Preparing", "Out for Delivery", "Delivered", "Cancelled"]
+        if new_status not in valid_statuses:
+            raise ValueError(f"Invalid status. Must be one of {valid_statuses}")
+        if new_status == "Cancelled" and self._status == "Delivered":
+            raise ValueError(f"Order {self.get_order_number()} is already delivered and cannot be cancelled.")
+        inventory = self._restaurant.get_inventory()
+        if new_status == "Cancelled" and self._status != "Cancelled":
+            if inventory is not None:
+                for menu_item, quantity in self._reserved.items():
+                    inventory.release(menu_item, quantity)
+            self._reserved = {}
+        elif self._status == "Cancelled" and new_status != "Cancelled" and inventory is not None:
+            taken = inventory.reserve_lines(self._items)
+            if taken is None:
+                raise ValueError(f"Not enough stock to reopen order {self.get_order_number()}.")
+            self._reserved = taken
+        if new_status == "Delivered":
+            self._reserved = {}
+        self._status = new_status
+        if Order.history_index is not None:
+            Order.history_index.update_order(self)
+        print(f"Order {self.get_order_number()} status updated to: {self.get_status()}")
+
+    def display_order_details(self):
+        """
+        Returns a detailed, formatted summary of the order as a string.
+
+        This includes the order number, client and restaurant names, order time, current status,
+        a list of all items with their quantities and individual prices, and the total order price.
+        """
+        details = [
+            f"Order Details (Order #{self.get_order_number()})",
+            f"Client: {self.get_client().get_name()}",
+            f"Restaurant: {self.get_restaurant().get_name()}",
+            f"Order Time: {self.get_order_time().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Status: {self.get_status()}",
+            "Items:"
+        ]
+        if not self._items:
+            details.append("No items in this order.")
+        for item, quantity in self._items.items():
+            details.append(f"{item.get_name()} x {quantity} (${item.get_price():.2f} each)")
+        details.append(f"Total: ${self.get_total_price():.2f}")
+        return "\n".join(details)
@@ -0,0 +1,415 @@
+import weakref
+from abc import ABC, abstractmethod
+
+from .order import Order
+from .restaurant import Restaurant
+
+class PricingRule(ABC):
+    """
+    Base class for the discount rules of the pricing engine.
+
+    A rule applies either to the lines of one dish (item_name) or to every line of an order
+    (item_name None), optionally only during a time of day given by start_hour and end_hour.
+    The window includes start_hour and excludes end_hour, and may wrap around midnight
+    (for example, 22 to 2). Subclasses define how large the discount of a single line is,
+    given the part of the line price that earlier rules have not discounted yet.
+    """
+    def __init__(self, item_name: str | None = None, start_hour: int | None = None, end_hour: int | None = None):
+        """
+        Initializes the common attributes of a pricing rule.
+
+        :param item_name: the name of the dish the rule applies to, or None for every dish.
+        :param start_hour: the first hour of the day the rule applies in (0-23), or None for all day.
+        :param end_hour: the hour of the day the rule stops applying (1-24), or None for all day.
+        :type item_name: str | None
+        :type start_hour: int | None
+        :type end_hour: int | None
+        :raises TypeError: if any parameter is not of the expected type.
+        :raises ValueError: if item_name is empty, only one of the hours is given or an hour is out of range.
+        """
+        if item_name is not None and not isinstance(item_name, str):
+            raise TypeError("Rule item name must be a string or None.")
+        if item_name == "":
+            raise ValueError("Rule item name cannot be empty.")
+        if (start_hour is None) != (end_hour is None):
+            raise ValueError("Rule start_hour and end_hour must be given together.")
+        if start_hour is not None:
+            if not isinstance(start_hour, int) or not isinstance(end_hour, int):
+                raise TypeError("Rule hours must be integers.")
+            if not 0 <= start_hour <= 23 or not 1 <= end_hour <= 24 or start_hour == end_hour:
+                raise ValueError("Rule hours must be a non-empty window between 0 and 24.")
+        self._item_name = item_name
+        self._start_hour = start_hour
+        self._end_hour = end_hour
+
+    def get_item_name(self) -> str | None:
+        """
+        Retrieves the name of the dish the rule applies to.
+
+        :return: the dish name, or None if the rule applies to every dish.
+        :rtype: str | None
+        """
+        return self._item_name
+
+    def applies_at_hour(self, hour: int) -> bool:
+        """
+        Checks whether the rule applies to orders placed during the given hour.
+
+        :param hour: the hour of the day (0-23).
+        :type hour: int
+        :return: True if the rule applies during that hour, False otherwise.
+        :rtype: bool
+        """
+        if self._start_hour is None:
+            return True
+        if self._start_hour < self._end_hour:
+            return self._start_hour <= hour < self._end_hour
+        return hour >= self._start_hour or hour < self._end_hour
+
+    @abstractmethod
+    def get_line_discount(self, unit_price: float, quantity: int, remaining: float) -> float:
+        """
+        Computes the discount the rule gives on one order line.
+
+        :param unit_price: the price of one unit of the dish.
+        :type unit_price: float
+        :param quantity: the number of units ordered.
+        :type quantity: int
+        :param remaining: the amount of the line still to be paid after the rules applied before this one.
+        :type remaining: float
+        :return: the discount amount as a float, at most remaining.
+        :rtype: float
+        """
+
+class PercentOffRule(PricingRule):
+    """
+    Gives a percentage discount on the matching order lines.
+
+    With start_hour and end_hour it describes a time-of-day special, for example 20% off
+    every dish between 15:00 and 17:00.
+    """
+    def __init__(self, percent: float, item_name: str | None = None,
+                 start_hour: int | None = None, end_hour: int | None = None):
+        """
+        Initializes a new PercentOffRule object.
+
+        :param percent: the discount in percent. Must be a float greater than 0 and at most 100.
+        :param item_name: the name of the dish the rule applies to, or None for every dish.
+        :param start_hour: the first hour of the day the rule applies in, or None for all day.
+        :param end_hour: the hour of the day the rule stops applying, or None for all day.
+        :type percent: float
+        :type item_name: str | None
+        :type start_hour: int | None
+        :type end_hour: int | None
+        :raises TypeError: if any parameter is not of the expected type.
+        :raises ValueError: if percent is out of range or the other parameters fail validation.
+        """
+        super().__init__(item_name, start_hour, end_hour)
+        if not isinstance(percent, float):
+            raise TypeError("Discount percent must be a float.")
+        if not 0 < percent <= 100:
+            raise ValueError("Discount percent must be greater than 0 and at most 100.")
+        self._fraction = percent / 100
+
+    def get_line_discount(self, unit_price: float, quantity: int, remaining: float) -> float:
+        """
+        Computes the percentage discount on the part of one order line that is still to be paid.
+
+        :param unit_price: the price of one unit of the dish.
+        :type unit_price: float
+        :param quantity: the number of units ordered.
+        :type quantity: int
+        :param remaining: the amount of the line still to be paid after the rules applied before this one.
+        :type remaining: float
+        :return: the discount amount as a float.
+        :rtype: float
+        """
+        return remaining * self._fraction
+
+class BuyNGetMRule(PricingRule):
+    """
+    Makes some units of a dish free: for every buy units paid, the next free units cost nothing.
+    """
+    def __init__(self, item_name: str, buy: int, free: int,
+                 start_hour: int | None = None, end_hour: int | None = None):
+        """
+        Initializes a new BuyNGetMRule object.
+
+        :param item_name: the name of the dish the rule applies to. Must be a non-empty string.
+        :param buy: the number of units that have to be paid. Must be a positive integer.
+        :param free: the number of units given for free. Must be a positive integer.
+        :param start_hour: the first hour of the day the rule applies in, or None for all day.
+        :param end_hour: the hour of the day the rule stops applying, or None for all day.
+        :type item_name: str
+        :type buy: int
+        :type free: int
+        :type start_hour: int | None
+        :type end_hour: int | None
+        :raises TypeError: if any parameter is not of the expected type.
+        :raises ValueError: if any parameter fails validation.
+        """
+        if item_name is None:
+            raise ValueError("Buy-N-get-M rules must name a dish.")
+        super().__init__(item_name, start_hour, end_hour)
+        if not isinstance(buy, int) or not isinstance(free, int):
+            raise TypeError("Rule buy and free counts must be integers.")
+        if buy <= 0 or free <= 0:
+            raise ValueError("Rule buy and free counts must be positive integers.")
+        self._buy = buy
+        self._free = free
+
+    def get_line_discount(self, unit_price: float, quantity: int, remaining: float) -> float:
+        """
+        Computes the value of the free units on one order line.
+
+        The free units are valued at the line's remaining amount per unit, so the result is the
+        same whether a percentage rule for the dish was applied before this rule or after it.
+
+        :param unit_price: the price of one unit of the dish.
+        :type unit_price: float
+        :param quantity: the number of units ordered.
+        :type quantity: int
+        :param remaining: the amount of the line still to be paid after the rules applied before this one.
+        :type remaining: float
+        :return: the discount amount as a float, at most remaining.
+        :rtype: float
+        """
+        return quantity // (self._buy + self._free) * self._free * remaining / quantity
+
+class PriceBreakdown:
+    """
+    Represents the priced result of an order: subtotal, discount, tax and total.
+    """
+    def __init__(self, order_number: int, subtotal: float, discount: float, tax: float):
+        """
+        Initializes a new PriceBreakdown object. Amounts are rounded to cents.
+
+        :param order_number: the number of the priced order.
+        :param subtotal: the sum of price x quantity of all lines.
+        :param discount: the total discount of all matching rules.
+        :param tax: the tax charged on the discounted subtotal.
+        :type order_number: int
+        :type subtotal: float
+        :type discount: float
+        :type tax: float
+        """
+        self._order_number = order_number
+        self._subtotal = round(subtotal, 2)
+        self._discount = round(discount, 2)
+        self._tax = round(tax, 2)
+        self._total = round(self._subtotal - self._discount + self._tax, 2)
+
+    def get_order_number(self) -> int:
+        """
+        Retrieves the number of the priced order.
+
+        :return: the order number as an integer.
+        :rtype: int
+        """
+        return self._order_number
+    def get_subtotal(self) -> float:
+        """
+        Retrieves the order subtotal before discounts and tax.
+
+        :return: the subtotal as a float.
+        :rtype: float
+        """
+        return self._subtotal
+    def get_discount(self) -> float:
+        """
+        Retrieves the total discount of the order.
+
+        :return: the discount as a float.
+        :rtype: float
+        """
+        return self._discount
+    def get_tax(self) -> float:
+        """
+        Retrieves the tax charged on the order.
+
+        :return: the tax as a float.
+        :rtype: float
+        """
+        return self._tax
+    def get_total(self) -> float:
+        """
+        Retrieves the amount the client pays.
+
+        :return: the total as a float.
+        :rtype: float
+        """
+        return self._total
+
+    def __str__(self):
+        """
+        Returns a human-readable string representation of the PriceBreakdown object.
+
+        :return: a formatted string with the subtotal, discount, tax and total.
+        :rtype: str
+        """
+        return (f"\n"
+                f"Order #{self._order_number} pricing\n"
+                f"Subtotal: ${self._subtotal:.2f}\n"
+                f"Discount: -${self._discount:.2f}\n"
+                f"Tax: ${self._tax:.2f}\n"
+                f"Total: ${self._total:.2f}")
+
+class PricingEngine:
+    """
+    Prices orders using discount rules and tax rates configured per restaurant.
+
+    The rules of a restaurant are compiled into a table with one entry per hour of the day,
+    each mapping dish names to the rules that apply to them, plus the rules that apply to
+    every dish. The table is rebuilt only after the rules of the restaurant change, so pricing
+    an order costs one lookup per line plus the matching rules. The engine remembers the
+    priced lines of every order and reprices only the lines that changed since the last call.
+
+    Rules are applied one after another to what is left of the line price: first the rules of
+    the dish in the order they were added, then the rules for every dish. A whole-order percent
+    off therefore never discounts units that a buy-N-get-M rule has already made free.
+    """
+    def __init__(self):
+        """
+        Initializes a new PricingEngine object without any rules.
+        """
+        self._rules: dict[Restaurant, list[PricingRule]] = {}
+        self._tax_rates: dict[Restaurant, float] = {}
+        self._tables: dict[Restaurant, list[tuple[dict[str, list[PricingRule]], list[PricingRule]]]] = {}
+        self._versions: dict[Restaurant, int] = {}
+        self._priced_lines: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def add_rule(self, restaurant: Restaurant, rule: PricingRule):
+        """
+        Adds a discount rule to a restaurant.
+
+        :param restaurant: the Restaurant object the rule belongs to.
+        :type restaurant: Restaurant
+        :param rule: the rule to add.
+        :type rule: PricingRule
+        :raises TypeError: if restaurant is not a Restaurant object or rule is not a PricingRule.
+        """
+        if not isinstance(restaurant, Restaurant):
+            raise TypeError("Pricing rules must belong to a valid Restaurant.")
+        if not isinstance(rule, PricingRule):
+            raise TypeError("Can only add PricingRule objects.")
+        self._rules.setdefault(restaurant, []).append(rule)
+        self._invalidate(restaurant)
+
+    def set_tax_rate(self, restaurant: Restaurant, percent: float):
+        """
+        Sets the tax rate charged on orders of a restaurant.
+
+        :param restaurant: the Restaurant object the tax rate belongs to.
+        :type restaurant: Restaurant
+        :param percent: the tax rate in percent. Must be a non-negative float.
+        :type percent: float
+        :raises TypeError: if restaurant is not a Restaurant object or percent is not a float.
+        :raises ValueError: if percent is negative.
+        """
+        if not isinstance(restaurant, Restaurant):
+            raise TypeError("Tax rate must belong to a valid Restaurant.")
+        if not isinstance(percent, float):
+            raise TypeError("Tax rate must be a float.")
+        if percent < 0:
+            raise ValueError("Tax rate cannot be negative.")
+        self._tax_rates[restaurant] = percent / 100
+        self._invalidate(restaurant)
+
+    def price_order(self, order: Order) -> PriceBreakdown:
+        """
+        Prices an order, reusing the results of lines that did not change since it was last priced.
+
+        :param order: the Order object to price.
+        :type order: Order
+        :return: the price breakdown of the order.
+        :rtype: PriceBreakdown
+        :raises TypeError: if order is not an Order object.
+        """
+        if not isinstance(order, Order):
+            raise TypeError("Can only price Order objects.")
+        restaurant = order.get_restaurant()
+        table = self._get_table(restaurant)
+        return self._price(order, restaurant, table)
+
+    def price_orders(self, orders) -> list[PriceBreakdown]:
+        """
+        Prices many orders at once, looking up the rule table of each restaurant only once.
+
+        :param orders: an iterable of Order objects.
+        :type orders: Iterable[Order]
+        :return: the price breakdowns in the order of the input.
+        :rtype: list[PriceBreakdown]
+        :raises TypeError: if the iterable yields an object that is not an Order.
+        """
+        tables = {}
+        breakdowns = []
+        for order in orders:
+            if not isinstance(order, Order):
+                raise TypeError("Can only price Order objects.")
+            restaurant = order.get_restaurant()
+            table = tables.get(restaurant)
+            if table is None:
+                table = tables[restaurant] = self._get_table(restaurant)
+            breakdowns.append(self._price(order, restaurant, table))
+        return breakdowns
+
+    def _invalidate(self, restaurant: Restaurant):
+        """
+        Drops the compiled table of a restaurant and makes cached line prices stale.
+        """
+        self._tables.pop(restaurant, None)
+        self._versions[restaurant] = self._versions.get(restaurant, 0) + 1
+
+    def _get_table(self, restaurant: Restaurant) -> list:
+        """
+        Returns the compiled rule table of a restaurant, building it if needed.
+        """
+        table = self._tables.get(restaurant)
+        if table is None:
+            table = []
+            rules = self._rules.get(restaurant, [])
+            for hour in range(24):
+                by_item: dict[str, list[PricingRule]] = {}
+                for_all: list[PricingRule] = []
+                for rule in rules:
+                    if not rule.applies_at_hour(hour):
+                        continue
+                    if rule.get_item_name() is None:
+                        for_all.append(rule)
+                    else:
+                        by_item.setdefault(rule.get_item_name(), []).append(rule)
+                table.append((by_item, for_all))
+            self._tables[restaurant] = table
+        return table
+
+    def _price(self, order: Order, restaurant: Restaurant, table: list) -> PriceBreakdown:
+        """
+        Prices the lines of an order with a compiled rule table, reusing unchanged lines.
+        """
+        by_item, for_all = table[order.get_order_time().hour]
+        version = self._versions.get(restaurant, 0)
+        cached = self._priced_lines.get(order)
+        if cached is None or cached[0] != version:
+            cached_lines = {}
+        else:
+            cached_lines = cached[1]
+        priced_lines = {}
+        subtotal = 0.0
+        discount = 0.0
+        for menu_item, quantity in order.get_items().items():
+            price = menu_item.get_price()
+            line = cached_lines.get(menu_item)
+            if line is None or line[0] != quantity or line[1] != price:
+                line_subtotal = price * quantity
+                remaining = line_subtotal
+                for rule in by_item.get(menu_item.get_name(), ()):
+                    remaining -= min(rule.get_line_discount(price, quantity, remaining), remaining)
+                for rule in for_all:
+                    remaining -= min(rule.get_line_discount(price, quantity, remaining), remaining)
+                line = (quantity, price, line_subtotal, line_subtotal - remaining)
+            priced_lines[menu_item] = line
+            subtotal += line[2]
+            discount += line[3]
+        self._priced_lines[order] = (version, priced_lines)
+        tax = (subtotal - discount) * self._tax_rates.get(restaurant, 0.0)
+        return PriceBreakdown(order.get_order_number(), subtotal, discount, tax)
@@ -0,0 +1,139 @@
+import heapq
+
+from .order import Order
+from .restaurant import Restaurant
+
+class RecommendationEngine:
+    """
+    Suggests dishes that are frequently ordered together, learned from past orders.
+
+    For every restaurant the engine keeps a sparse co-occurrence table: for each dish, the dishes
+    that appeared in the same orders, with a weight. Recording an order updates only the pairs of
+    its lines. Memory is bounded because every dish keeps at most max_neighbours partners; when
+    the list is full the weakest partner is dropped. Old orders fade out with exponential decay:
+    instead of shrinking every stored weight, each new order adds a weight that grows by a constant
+    factor, so an order half_life_orders orders old counts half as much as the newest one. When the
+    increment gets large, all weights of the restaurant are rescaled and negligible ones removed.
+    """
+    _RESCALE_LIMIT = 1e12
+    _MIN_WEIGHT = 1e-6
+
+    def __init__(self, max_neighbours: int = 50, half_life_orders: int = 10000):
+        """
+        Initializes a new RecommendationEngine object without any order history.
+
+        :param max_neighbours: the maximum number of partner dishes kept per dish. Must be a positive integer.
+        :param half_life_orders: after how many recorded orders of a restaurant the weight of an order halves.
+        Must be a positive integer.
+        :type max_neighbours: int
+        :type half_life_orders: int
+        :raises TypeError: if any parameter is not an integer.
+        :raises ValueError: if any parameter is not positive.
+        """
+        if not isinstance(max_neighbours, int):
+            raise TypeError("Maximum number of neighbours must be an integer.")
+        if max_neighbours <= 0:
+            raise ValueError("Maximum number of neighbours must be a positive integer.")
+        if not isinstance(half_life_orders, int):
+            raise TypeError("Half-life must be an integer number of orders.")
+        if half_life_orders <= 0:
+            raise ValueError("Half-life must be a positive integer.")
+        self._max_neighbours = max_neighbours
+        self._growth = 2 ** (1 / half_life_orders)
+        self._pairs: dict[Restaurant, dict] = {}
+        self._increments: dict[Restaurant, float] = {}
+        self._orders_recorded = 0
+
+    def record_order(self, order: Order):
+        """
+        Adds the dishes of an order to the co-occurrence table of its restaurant.
+
+        :param order: the Order object whose lines were bought together.
+        :type order: Order
+        :raises TypeError: if order is not an Order object.
+        """
+        if not isinstance(order, Order):
+            raise TypeError("Can only record Order objects.")
+        restaurant = order.get_restaurant()
+        pairs = self._pairs.setdefault(restaurant, {})
+        increment = self._increments.get(restaurant, 1.0)
+        items = list(order.get_items())
+        if len(items) < 2:
+            items = []
+        for item in items:
+            neighbours = pairs.setdefault(item, {})
+            for other in items:
+                if other is item:
+                    continue
+                if other not in neighbours and len(neighbours) >= self._max_neighbours:
+                    del neighbours[min(neighbours, key=neighbours.__getitem__)]
+                neighbours[other] = neighbours.get(other, 0.0) + increment
+        increment *= self._growth
+        if increment > self._RESCALE_LIMIT:
+            self._rescale(pairs, increment)
+            increment = 1.0
+        self._increments[restaurant] = increment
+        self._orders_recorded += 1
+
+    def suggest(self, order: Order, k: int = 3) -> list:
+        """
+        Suggests the dishes most often ordered together with the current lines of an order.
+
+        Dishes already in the order and dishes that are not available are never suggested.
+
+        :param order: the Order object being checked out.
+        :type order: Order
+        :param k: the maximum number of suggestions. Must be a positive integer.
+        :type k: int
+        :return: a list of MenuItem objects, the strongest suggestion first.
+        :rtype: list[MenuItem]
+        :raises TypeError: if order is not an Order object or k is not an integer.
+        :raises ValueError: if k is not positive.
+        """
+        if not isinstance(order, Order):
+            raise TypeError("Can only make suggestions for Order objects.")
+        if not isinstance(k, int):
+            raise TypeError("Number of suggestions must be an integer.")
+        if k <= 0:
+            raise ValueError("Number of suggestions must be a positive integer.")
+        pairs = self._pairs.get(order.get_restaurant(), {})
+        lines = order.get_items()
+        scores = {}
+        for item in lines:
+            for other, weight in pairs.get(item, {}).items():
+                if other not in lines and other.get_is_available():
+                    scores[other] = scores.get(other, 0.0) + weight
+        return heapq.nlargest(k, scores, key=scores.__getitem__)
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves counters describing the size of the co-occurrence tables.
+
+        :return: a dictionary with the number of recorded orders, restaurants, tracked dishes,
+        stored pairs and the maximum number of pairs the current dishes can take.
+        :rtype: dict
+        """
+        dishes = sum(len(pairs) for pairs in self._pairs.values())
+        stored_pairs = sum(len(neighbours) for pairs in self._pairs.values() for neighbours in pairs.values())
+        return {
+            "orders_recorded": self._orders_recorded,
+            "restaurants": len(self._pairs),
+            "dishes": dishes,
+            "pairs": stored_pairs,
+            "max_pairs": dishes * self._max_neighbours,
+        }
+
+    def _rescale(self, pairs: dict, increment: float):
+        """
+        Divides all weights of a restaurant by the current increment and removes negligible ones.
+        """
+        for item in list(pairs):
+            neighbours = pairs[item]
+            for other in list(neighbours):
+                weight = neighbours[other] / increment
+                if weight < self._MIN_WEIGHT:
+                    del neighbours[other]
+                else:
+                    neighbours[other] = weight
+            if not neighbours:
+                del pairs[item]
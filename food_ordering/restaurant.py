@@ -0,0 +1,176 @@
+from .inventory import Inventory
+from .menu import Menu
+
+class Restaurant:
+    """
+    Represents a restaurant with its core details and manages its menu.
+    """
+    def __init__(self, name: str, address: str, phone: int, opening_hours: dict,
+                 cuisine_type: str, rating: float):
+        """
+        Initializes a new Restaurant object with comprehensive details.
+
+        This method validates all input parameters to ensure data integrity
+        for the restaurant's information.
+
+        :param name: the name of the restaurant. Must be a non-empty string.
+        :param address: the physical address of the restaurant. Must be a non-empty string.
+        :param phone: the contact phone number of the restaurant. Must be a positive integer.
+        :param opening_hours: a dictionary specifying the restaurant's opening hours
+        (for example, 'Monday': '9:00-22:00', 'Weekend': '10:00-23:00'). Must be a non-empty dictionary.
+        :param cuisine_type: the type of cuisine the restaurant specializes in (for example, "Italian", "Japanese").
+        Must be a non-empty string.
+        param rating: the average customer rating of the restaurant on a scale of 0 to 5.
+        Must be a float between 0 and 5 (inclusive).
+        :raises TypeError: if any parameter is not of the expected type.
+        :raises ValueError: if any parameter fails validation (e.g., empty string, non-positive phone, empty dict,
+        rating out of range).
+        """
+        if not isinstance(name, str):
+            raise TypeError("Restaurant name must be a string.")
+        if not name:
+            raise ValueError("Restaurant name cannot be empty.")
+        if not isinstance(address, str):
+            raise TypeError("Restaurant address must be a string.")
+        if not address:
+            raise ValueError("Restaurant address cannot be empty.")
+        if not isinstance(phone, int):
+            raise TypeError("Restaurant phone must be a integer.")
+        if phone <= 0:
+            raise ValueError("Restaurant phone must be a positive integer.")
+        if not isinstance(opening_hours, dict):
+            raise TypeError("Restaurant opening_hours must be a dict.")
+        if not opening_hours:
+            raise ValueError("Restaurant opening_hours cannot be empty.")
+        if not isinstance(cuisine_type, str):
+            raise TypeError("Restaurant cuisine_type must be a string.")
+        if not cuisine_type:
+            raise ValueError("Restaurant cuisine_type cannot be empty.")
+        if not isinstance(rating, float):
+            raise TypeError("Restaurant rating must be a float.")
+        if not 0 <= rating <= 5:
+            raise ValueError("Rating must be between 0 and 5.")
+        self._name = name
+        self._address = address
+        self._phone = phone
+        self._opening_hours = opening_hours
+        self._cuisine_type = cuisine_type
+        self._rating = rating
+        self._menu: Menu | None = None
+        self._inventory: Inventory | None = None
+
+    def get_name(self) -> str:
+        """
+        Retrieves the name of the restaurant.
+
+        :return: the name of the restaurant as a string.
+        :rtype: str
+        """
+        return self._name
+    def get_address(self) -> str:
+        """
+        Retrieves the address of the restaurant.
+
+        :return: the address of the restaurant as a string.
+        :rtype: str
+        """
+        return self._address
+    def get_phone(self) -> int:
+        """
+        Retrieves the phone number of the restaurant.
+
+        :return: the phone number of the restaurant as an integer.
+        :rtype: int
+        """
+        return self._phone
+    def get_opening_hours(self) -> dict:
+        """
+        Retrieves the opening hours of the restaurant.
+
+        :return: a dictionary representing the restaurant's opening hours.
+        :rtype: dict
+        """
+        return self._opening_hours
+    def get_cuisine_type(self) -> str:
+        """
+        Retrieves the cuisine type of the restaurant.
+
+        :return: the cuisine type of the restaurant as a string.
+        :rtype: str
+        """
+        return self._cuisine_type
+    def get_rating(self) -> float:
+        """
+        Retrieves the average rating of the restaurant.
+
+        :return: the rating of the restaurant as a float (between 0 and 5).
+        :rtype: float
+        """
+        return self._rating
+    def get_menu(self) -> Menu | None:
+        """
+        Retrieves the current menu assigned to the restaurant.
+
+        :return: the Menu object assigned to the restaurant, or None if no menu is set.
+        :rtype: Menu | None
+        """
+        return self._menu
+
+    def set_menu(self, menu: Menu):
+        """
+        Assigns a Menu object to the restaurant.
+
+        This method links a specific menu to the restaurant, allowing it to offer
+        those menu items. It validates that the provided object is indeed a Menu instance.
+
+        :param menu: the Menu object to be assigned to the restaurant.
+        :type menu: Menu
+        :raises TypeError: if the provided 'menu' is not an instance of the Menu class.
+        """
+        if not isinstance(menu, Menu):
+            raise TypeError("Menu must be an instance of the Menu class.")
+        self._menu = menu
+        print(f"Menu '{menu.get_name()}' has been set for restaurant '{self.get_name()}'.")
+
+    def get_inventory(self) -> Inventory | None:
+        """
+        Retrieves the inventory that tracks the stock of the restaurant's dishes.
+
+        :return: the Inventory object of the restaurant, or None if stock is not tracked.
+        :rtype: Inventory | None
+        """
+        return self._inventory
+
+    def set_inventory(self, inventory: Inventory):
+        """
+        Assigns an Inventory object to the restaurant.
+
+        Once an inventory is set, orders from the restaurant reserve stock for the dishes they contain.
+
+        :param inventory: the Inventory object to be assigned to the restaurant.
+        :type inventory: Inventory
+        :raises TypeError: if the provided 'inventory' is not an instance of the Inventory class.
+        """
+        if not isinstance(inventory, Inventory):
+            raise TypeError("Inventory must be an instance of the Inventory class.")
+        self._inventory = inventory
+
+    def __str__(self):
+        """
+        Returns a human-readable string representation of the Restaurant object.
+
+        This representation includes the restaurant's name, address, phone number,
+        cuisine type, opening hours, rating, and the name of its currently assigned menu.
+
+        :return: a formatted string detailing the restaurant's information.
+        :rtype: str
+        """
+        menu_status = self._menu.get_name() if self._menu else "No menu set"
+        return (f"\n"
+                f"Restaurant Name: {self._name}\n"
+                f"Address: {self._address}\n"
+                f"Phone: {self._phone}\n"
+                f"Cuisine: {self._cuisine_type}\n"
+                f"Opening hours: {self._opening_hours}\n"
+                f"Rating: {self._rating}/5 stars\n"
+                f"Current menu: {menu_status}")
@@ -0,0 +1,369 @@
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+
+from .menu import Menu
+from .menu_item import MenuItem
+
+class MenuSearchIndex:
+    """
+    Represents a full-text search index over the names and descriptions of menu items across all menus.
+
+    The index keeps an inverted index of tokens, a sorted vocabulary for prefix autocomplete and
+    a trigram index over the vocabulary for typo-tolerant matching. Menus attached to the index
+    update it incrementally on every add_item and remove_item call.
+
+    The postings of every token are impact-ordered: the items are grouped into blocks by the
+    weight of the token in them, heaviest block first. A search scores items block by block in
+    order of their possible contribution and stops as soon as no item that was not scored yet
+    can still enter the top results, so a query rarely walks the whole posting lists.
+
+    Writers of all menus are serialized by the index's own lock. Readers take no lock: blocks
+    are only ever appended to, and every other structure a reader walks (the block lists, the
+    vocabulary and the trigram lists) is replaced with a new copy instead of being modified
+    in place when something is removed from it. Removed items stay in their blocks as dead
+    entries that readers skip, until more than half of a token's postings are dead and the
+    blocks of that token are rebuilt without them.
+    """
+    NAME_WEIGHT = 3.0
+    PREFIX_WEIGHT = 0.75
+    FUZZY_WEIGHT = 0.5
+    MAX_EXPANSIONS = 50
+    RECENT_TERMS_LIMIT = 1024
+    _TOKEN_PATTERN = re.compile(r"\w+")
+
+    def __init__(self):
+        """
+        Initializes a new, empty MenuSearchIndex object.
+        """
+        self._next_doc_id = 0
+        self._documents: dict[int, MenuItem] = {}
+        self._doc_terms: dict[int, dict[str, float]] = {}
+        self._docs_by_menu: dict[Menu, dict[str, list[int]]] = {}
+        self._postings: dict[str, list[tuple[float, list[int]]]] = {}
+        self._dead_postings: dict[str, int] = {}
+        self._vocabulary: tuple[list[str], list[str]] = ([], [])
+        self._trigrams: dict[str, list[str]] = {}
+        self._write_lock = threading.Lock()
+
+    def get_item_count(self) -> int:
+        """
+        Retrieves the number of menu items currently indexed.
+
+        :return: the number of indexed menu items as an integer.
+        :rtype: int
+        """
+        return len(self._documents)
+
+    def add_item(self, menu: Menu, item: MenuItem):
+        """
+        Indexes a single MenuItem that belongs to the given menu.
+
+        Tokens from the name are weighted higher than tokens from the description.
+        New tokens are inserted into the sorted vocabulary and the trigram index.
+        New tokens first go to a small sorted list of recent terms, which is merged into
+        the main vocabulary once it holds RECENT_TERMS_LIMIT terms.
+
+        :param menu: the Menu object the item belongs to.
+        :type menu: Menu
+        :param item: the MenuItem object to index.
+        :type item: MenuItem
+        :raises TypeError: if menu is not a Menu object or item is not a MenuItem object.
+        """
+        if not isinstance(menu, Menu):
+            raise TypeError("Can only index items of Menu objects.")
+        if not isinstance(item, MenuItem):
+            raise TypeError("Can only index MenuItem objects.")
+        terms: dict[str, float] = {}
+        for token in self._tokenize(item.get_name()):
+            terms[token] = terms.get(token, 0.0) + self.NAME_WEIGHT
+        for token in self._tokenize(item.get_description()):
+            terms[token] = terms.get(token, 0.0) + 1.0
+        with self._write_lock:
+            doc_id = self._next_doc_id
+            self._next_doc_id += 1
+            # The document is published before its postings, so readers never find an unknown id.
+            self._documents[doc_id] = item
+            self._doc_terms[doc_id] = terms
+            for token, weight in terms.items():
+                blocks = self._postings.get(token)
+                if blocks is None:
+                    self._postings[token] = [(weight, [doc_id])]
+                    self._add_term(token)
+                    continue
+                for block_weight, doc_ids in blocks:
+                    if block_weight == weight:
+                        doc_ids.append(doc_id)
+                        break
+                else:
+                    self._postings[token] = sorted(blocks + [(weight, [doc_id])],
+                                                   key=lambda block: block[0], reverse=True)
+            self._docs_by_menu.setdefault(menu, {}).setdefault(item.get_name(), []).append(doc_id)
+
+    def remove_item(self, menu: Menu, item_name: str):
+        """
+        Removes all items with the given name of the given menu from the index.
+
+        Tokens that are no longer used by any item are dropped from the vocabulary
+        and the trigram index.
+
+        :param menu: the Menu object the items belong to.
+        :type menu: Menu
+        :param item_name: the name of the menu items to remove.
+        :type item_name: str
+        """
+        with self._write_lock:
+            doc_ids = self._docs_by_menu.get(menu, {}).pop(item_name, [])
+            for doc_id in doc_ids:
+                # Without its terms the item is a dead entry that readers skip.
+                for token in self._doc_terms.pop(doc_id):
+                    dead = self._dead_postings.get(token, 0) + 1
+                    total = sum(len(block_doc_ids) for _, block_doc_ids in self._postings[token])
+                    if dead == total:
+                        del self._postings[token]
+                        self._dead_postings.pop(token, None)
+                        self._remove_term(token)
+                    elif dead * 2 > total:
+                        blocks = []
+                        for block_weight, block_doc_ids in self._postings[token]:
+                            block_doc_ids = [other for other in block_doc_ids if other in self._doc_terms]
+                            if block_doc_ids:
+                                blocks.append((block_weight, block_doc_ids))
+                        self._postings[token] = blocks
+                        self._dead_postings.pop(token, None)
+                    else:
+                        self._dead_postings[token] = dead
+                del self._documents[doc_id]
+
+    def search(self, query: str, limit: int = 10) -> list[MenuItem]:
+        """
+        Searches the indexed menu items and returns them ranked by relevance.
+
+        Every query token is matched exactly first. If a token is not in the vocabulary,
+        it is expanded to the MAX_EXPANSIONS most common vocabulary terms it is a prefix of,
+        and if there are none, to the terms within a small edit distance of it.
+
+        Posting blocks are visited in order of the largest score they can add. An item is scored
+        completely from its own terms the first time it is seen, and the search stops once the
+        lowest of the best scores found so far is at least the largest score an unseen item
+        could still reach, which is the sum of the next block bound of every query term.
+
+        :param query: the search text (for example, "tuna" or "feta cheese").
+        :type query: str
+        :param limit: the maximum number of results to return. Must be a positive integer.
+        :type limit: int
+        :return: a list of matching MenuItem objects, most relevant first.
+        :rtype: list[MenuItem]
+        :raises TypeError: if query is not a string or limit is not an integer.
+        :raises ValueError: if limit is not a positive integer.
+        """
+        if not isinstance(query, str):
+            raise TypeError("Search query must be a string.")
+        if not isinstance(limit, int):
+            raise TypeError("Search limit must be an integer.")
+        if limit <= 0:
+            raise ValueError("Search limit must be a positive integer.")
+        document_count = len(self._documents)
+        match_weights: dict[str, float] = {}
+        for token in set(self._tokenize(query)):
+            for term, match_weight in self._expand_token(token):
+                match_weights[term] = match_weights.get(term, 0.0) + match_weight
+        query_weights: dict[str, float] = {}
+        remaining: dict[str, float] = {}
+        segments = []
+        for term, match_weight in match_weights.items():
+            blocks = self._postings.get(term)
+            frequency = self._get_document_frequency(term)
+            if not blocks or frequency <= 0:
+                continue
+            idf = math.log(1.0 + document_count / frequency)
+            query_weights[term] = match_weight * idf
+            bounds = [query_weights[term] * block_weight for block_weight, _ in blocks] + [0.0]
+            remaining[term] = bounds[0]
+            for position, (_, doc_ids) in enumerate(blocks):
+                segments.append((bounds[position], term, doc_ids, bounds[position + 1]))
+        segments.sort(key=lambda segment: segment[0], reverse=True)
+        chunk_size = max(limit, 64)
+        best: list[tuple[float, int]] = []
+        seen: set[int] = set()
+        for _, term, doc_ids, next_bound in segments:
+            for start in range(0, len(doc_ids), chunk_size):
+                if len(best) == limit and best[0][0] >= sum(remaining.values()):
+                    break
+                for doc_id in doc_ids[start:start + chunk_size]:
+                    if doc_id in seen:
+                        continue
+                    seen.add(doc_id)
+                    terms = self._doc_terms.get(doc_id)
+                    if terms is None:
+                        continue
+                    score = sum(weight * query_weights[token]
+                                for token, weight in terms.items() if token in query_weights)
+                    # Ties go to the item that was indexed first.
+                    entry = (score, -doc_id)
+                    if len(best) < limit:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+            else:
+                remaining[term] = next_bound
+                continue
+            break
+        best.sort(reverse=True)
+        items = [self._documents.get(-doc_id) for _, doc_id in best]
+        return [item for item in items if item is not None]
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> list[str]:
+        """
+        Suggests indexed terms that start with the given prefix.
+
+        All terms with the prefix are ranked by the number of menu items that contain them.
+
+        :param prefix: the beginning of a word typed by the customer.
+        :type prefix: str
+        :param limit: the maximum number of suggestions to return. Must be a positive integer.
+        :type limit: int
+        :return: a list of suggested terms, most common first.
+        :rtype: list[str]
+        :raises TypeError: if prefix is not a string or limit is not an integer.
+        :raises ValueError: if limit is not a positive integer.
+        """
+        if not isinstance(prefix, str):
+            raise TypeError("Autocomplete prefix must be a string.")
+        if not isinstance(limit, int):
+            raise TypeError("Autocomplete limit must be an integer.")
+        if limit <= 0:
+            raise ValueError("Autocomplete limit must be a positive integer.")
+        prefix = prefix.lower()
+        if not prefix:
+            return []
+        terms = self._get_prefix_terms(prefix)
+        return heapq.nlargest(limit, terms, key=self._get_document_frequency)
+
+    def _add_term(self, term: str):
+        """
+        Publishes a new term in the vocabulary and the trigram index. Must be called under the write lock.
+        """
+        vocabulary, recent_terms = self._vocabulary
+        recent_terms = recent_terms[:]
+        insort(recent_terms, term)
+        if len(recent_terms) >= self.RECENT_TERMS_LIMIT:
+            self._vocabulary = (sorted(vocabulary + recent_terms), [])
+        else:
+            self._vocabulary = (vocabulary, recent_terms)
+        for trigram in self._get_trigrams(term):
+            terms = self._trigrams.get(trigram)
+            if terms is None:
+                self._trigrams[trigram] = [term]
+            else:
+                terms.append(term)
+
+    def _remove_term(self, term: str):
+        """
+        Removes a term that no longer occurs in any item from the vocabulary and the trigram index.
+        Must be called under the write lock.
+        """
+        vocabulary, recent_terms = self._vocabulary
+        position = bisect_left(recent_terms, term)
+        if position < len(recent_terms) and recent_terms[position] == term:
+            recent_terms = recent_terms[:position] + recent_terms[position + 1:]
+        else:
+            position = bisect_left(vocabulary, term)
+            vocabulary = vocabulary[:position] + vocabulary[position + 1:]
+        self._vocabulary = (vocabulary, recent_terms)
+        for trigram in self._get_trigrams(term):
+            terms = [other for other in self._trigrams[trigram] if other != term]
+            if terms:
+                self._trigrams[trigram] = terms
+            else:
+                del self._trigrams[trigram]
+
+    def _get_document_frequency(self, term: str) -> int:
+        """
+        Returns the number of indexed items that contain the term, not counting dead entries.
+        """
+        blocks = self._postings.get(term)
+        if not blocks:
+            return 0
+        return sum(len(doc_ids) for _, doc_ids in blocks) - self._dead_postings.get(term, 0)
+
+    def _tokenize(self, text: str) -> list[str]:
+        """
+        Splits text into lowercase word tokens.
+        """
+        return self._TOKEN_PATTERN.findall(text.lower())
+
+    def _expand_token(self, token: str) -> list[tuple[str, float]]:
+        """
+        Maps a query token to the vocabulary terms it should match, with a weight for each.
+        """
+        if token in self._postings:
+            return [(token, 1.0)]
+        prefix_terms = heapq.nlargest(self.MAX_EXPANSIONS, self._get_prefix_terms(token),
+                                      key=self._get_document_frequency)
+        if prefix_terms:
+            return [(term, self.PREFIX_WEIGHT) for term in prefix_terms]
+        return [(term, self.FUZZY_WEIGHT / distance) for term, distance in self._get_fuzzy_terms(token)]
+
+    def _get_prefix_terms(self, prefix: str) -> list[str]:
+        """
+        Returns all vocabulary terms starting with the prefix.
+        """
+        terms = []
+        for sorted_terms in self._vocabulary:
+            # Every term starting with the prefix sorts before the prefix followed by the largest code point.
+            terms += sorted_terms[bisect_left(sorted_terms, prefix):bisect_left(sorted_terms, prefix + "\U0010ffff")]
+        return terms
+
+    def _get_fuzzy_terms(self, token: str) -> list[tuple[str, int]]:
+        """
+        Returns vocabulary terms within the allowed edit distance of the token.
+
+        Candidates are taken from the trigram index and filtered by the number of shared
+        trigrams before the edit distance is computed.
+        """
+        max_distance = 1 if len(token) <= 5 else 2
+        token_trigrams = self._get_trigrams(token)
+        shared: dict[str, int] = {}
+        for trigram in token_trigrams:
+            for term in self._trigrams.get(trigram, ()):
+                shared[term] = shared.get(term, 0) + 1
+        min_shared = len(token_trigrams) - 3 * max_distance
+        matches = []
+        for term, count in shared.items():
+            if term not in self._postings:
+                continue
+            if count < min_shared or abs(len(term) - len(token)) > max_distance:
+                continue
+            distance = self._get_edit_distance(token, term, max_distance)
+            if distance <= max_distance:
+                matches.append((term, distance))
+        matches.sort(key=lambda match: (match[1], -self._get_document_frequency(match[0])))
+        return matches[:self.MAX_EXPANSIONS]
+
+    @staticmethod
+    def _get_trigrams(token: str) -> set[str]:
+        """
+        Returns the set of trigrams of the token padded with boundary markers.
+        """
+        padded = f"${token}$"
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    @staticmethod
+    def _get_edit_distance(first: str, second: str, max_distance: int) -> int:
+        """
+        Computes the Levenshtein distance between two strings, stopping early once
+        it is known to exceed max_distance.
+        """
+        previous_row = list(range(len(second) + 1))
+        for i, first_char in enumerate(first, 1):
+            current_row = [i]
+            for j, second_char in enumerate(second, 1):
+                current_row.append(min(previous_row[j] + 1, current_row[j - 1] + 1,
+                                       previous_row[j - 1] + (first_char != second_char)))
+            if min(current_row) > max_distance:
+                return max_distance + 1
+            previous_row = current_row
+        return previous_row[-1]
@@ -0,0 +1,153 @@
+import string
+from typing import TYPE_CHECKING
+
+from .notification import Notification
+
+if TYPE_CHECKING:
+    from .order import Order
+
+class NotificationTemplate:
+    """
+    Represents a notification message template for one event type, compiled once and rendered many times.
+
+    The template text uses str.format syntax with the fields order_number, client_name, client_email,
+    restaurant_name, status and total (for example, "Order #{order_number} is {status}.").
+    At construction the text is split into literal parts and field lookups, so rendering only
+    evaluates the fields the template actually uses and joins the parts once.
+    """
+    _FIELDS = {
+        "order_number": lambda order: order.get_order_number(),
+        "client_name": lambda order: order.get_client().get_name(),
+        "client_email": lambda order: order.get_client().get_email(),
+        "restaurant_name": lambda order: order.get_restaurant().get_name(),
+        "status": lambda order: order.get_status(),
+        "total": lambda order: order.get_total_price(),
+    }
+
+    def __init__(self, event_type: str, text: str):
+        """
+        Initializes and compiles a new NotificationTemplate object.
+
+        :param event_type: the event the template is used for (for example, "Confirmed"). Must be a non-empty string.
+        :param text: the template text. Must be a non-empty string using only the supported fields.
+        :type event_type: str
+        :type text: str
+        :raises TypeError: if event_type or text is not a string.
+        :raises ValueError: if event_type or text is empty, or text uses an unknown field.
+        """
+        if not isinstance(event_type, str):
+            raise TypeError("Template event type must be a string.")
+        if not event_type:
+            raise ValueError("Template event type cannot be empty.")
+        if not isinstance(text, str):
+            raise TypeError("Template text must be a string.")
+        if not text:
+            raise ValueError("Template text cannot be empty.")
+        parts = []
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(text):
+            if literal:
+                parts.append((literal, None, ""))
+            if field_name is None:
+                continue
+            if field_name not in self._FIELDS or conversion:
+                raise ValueError(f"Unknown template field '{field_name}'. Must be one of {list(self._FIELDS)}")
+            parts.append((None, self._FIELDS[field_name], format_spec))
+        self._event_type = event_type
+        self._text = text
+        self._parts = tuple(parts)
+
+    def get_event_type(self) -> str:
+        """
+        Retrieves the event type the template is used for.
+
+        :return: the event type as a string.
+        :rtype: str
+        """
+        return self._event_type
+    def get_text(self) -> str:
+        """
+        Retrieves the source text of the template.
+
+        :return: the template text as a string.
+        :rtype: str
+        """
+        return self._text
+
+    def render(self, order: "Order") -> str:
+        """
+        Renders the template for the given order.
+
+        :param order: the Order object whose details fill the template fields.
+        :type order: Order
+        :return: the rendered message as a string.
+        :rtype: str
+        """
+        return "".join([literal if getter is None else format(getter(order), format_spec)
+                        for literal, getter, format_spec in self._parts])
+
+class NotificationTemplates:
+    """
+    Keeps the compiled notification templates keyed by event type and creates notifications from them.
+
+    By default a template is registered for every order status.
+    """
+    DEFAULT_TEMPLATES = {
+        "Pending": "Your order #{order_number} from {restaurant_name} has been received.",
+        "Confirmed": "Your order #{order_number} from {restaurant_name} has been confirmed!",
+        "Preparing": "Your order #{order_number} is being prepared by {restaurant_name}.",
+        "Out for Delivery": "Your order #{order_number} is on its way!",
+        "Delivered": "Your order #{order_number} has been delivered. Total: ${total:.2f}. Enjoy your meal!",
+        "Cancelled": "Your order #{order_number} from {restaurant_name} has been cancelled.",
+    }
+
+    def __init__(self):
+        """
+        Initializes a new NotificationTemplates object with the default templates compiled.
+        """
+        self._templates: dict[str, NotificationTemplate] = {}
+        for event_type, text in self.DEFAULT_TEMPLATES.items():
+            self.register(event_type, text)
+
+    def register(self, event_type: str, text: str):
+        """
+        Compiles a template and registers it for the event type, replacing any previous one.
+
+        :param event_type: the event the template is used for.
+        :type event_type: str
+        :param text: the template text.
+        :type text: str
+        :raises TypeError: if event_type or text is not a string.
+        :raises ValueError: if the template is invalid.
+        """
+        self._templates[event_type] = NotificationTemplate(event_type, text)
+
+    def get_template(self, event_type: str) -> NotificationTemplate | None:
+        """
+        Retrieves the compiled template registered for the event type.
+
+        :param event_type: the event type to look up.
+        :type event_type: str
+        :return: the NotificationTemplate object, or None if no template is registered.
+        :rtype: NotificationTemplate | None
+        """
+        return self._templates.get(event_type)
+
+    def create_notification(self, event_type: str, order: "Order",
+                            notification_type: str = "Email") -> Notification:
+        """
+        Creates a Notification for the order's client from the template of the event type.
+
+        :param event_type: the event the notification is about (for example, "Confirmed").
+        :type event_type: str
+        :param order: the Order object the notification is about.
+        :type order: Order
+        :param notification_type: the type of notification (for example, "Email", "SMS"). Defaults to "Email".
+        :type notification_type: str
+        :return: a new Notification object addressed to the client of the order.
+        :rtype: Notification
+        :raises ValueError: if no template is registered for the event type.
+        """
+        template = self._templates.get(event_type)
+        if template is None:
+            raise ValueError(f"No notification template registered for event '{event_type}'.")
+        return Notification(template.render(order), order.get_client().get_email(), notification_type)